@@ -1,14 +1,23 @@
 """Core constructs for Jac Language."""
 
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
+import builtins
+from collections import deque
+from contextlib import suppress
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from dis import get_instructions
 from os import getenv
-from pickle import dumps as pdumps
 from re import IGNORECASE, compile
+from types import CodeType
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Generator,
+    Iterable,
     Mapping,
+    NoReturn,
     TypeVar,
     cast,
     get_args,
@@ -16,7 +25,10 @@ from typing import (
     get_type_hints,
 )
 
-from bson import ObjectId
+from bson import ObjectId, decode
+from bson.codec_options import CodecOptions
+from bson.int64 import Int64
+from bson.raw_bson import RawBSONDocument
 
 from jaclang.compiler.constant import EdgeDir
 from jaclang.runtimelib.architype import (
@@ -37,20 +49,129 @@ from jaclang.runtimelib.architype import (
 
 from orjson import dumps
 
-from pymongo import ASCENDING, DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    UpdateMany,
+    UpdateOne,
+)
 from pymongo.client_session import ClientSession
-from pymongo.errors import ConnectionFailure, OperationFailure
+from pymongo.errors import ConnectionFailure, DuplicateKeyError, OperationFailure
 
+from .cache import ANCHOR_CACHE
 from ..jaseci.datasources import Collection as BaseCollection
 from ..jaseci.utils import logger
 
 MANUAL_SAVE = getenv("MANUAL_SAVE")
+CHANGE_TRACKING = getenv("CHANGE_TRACKING") or "hash"
+EDGE_BUCKET_SIZE = int(getenv("EDGE_BUCKET_SIZE") or "0")
+EDGE_BUCKET_BY_TYPE = getenv("EDGE_BUCKET_BY_TYPE") == "true"
+EDGE_REF_FORMAT = getenv("EDGE_REF_FORMAT") or "string"
+LAZY_HYDRATION = getenv("LAZY_HYDRATION") == "true"
+RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
 GENERIC_ID_REGEX = compile(r"^(n|e|w):([^:]*):([a-f\d]{24})$", IGNORECASE)
 NODE_ID_REGEX = compile(r"^n:([^:]*):([a-f\d]{24})$", IGNORECASE)
 EDGE_ID_REGEX = compile(r"^e:([^:]*):([a-f\d]{24})$", IGNORECASE)
 WALKER_ID_REGEX = compile(r"^w:([^:]*):([a-f\d]{24})$", IGNORECASE)
 T = TypeVar("T")
 TBA = TypeVar("TBA", bound="BaseArchitype")
+TANC = TypeVar("TANC", bound="BaseAnchor")
+IMMUTABLE_TYPES: set[type] = {
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    ObjectId,
+    Int64,
+    datetime,
+    date,
+    time,
+    timedelta,
+}
+SERIALIZERS: dict[type, Callable[[Any], dict[str, Any]]] = {}
+DECODING_PLANS: dict[type, list[tuple[str, type | None, type]]] = {}
+EDGE_PROBES: dict[type, Any] = {}
+TYPE_CHECKED_FILTERS: dict[CodeType, bool] = {}
+PROBE_UNRESOLVED = (
+    "__eq__",
+    "__ne__",
+    "__lt__",
+    "__le__",
+    "__gt__",
+    "__ge__",
+    "__bool__",
+    "__hash__",
+)
+LOAD_SCOPED = {
+    "LOAD_GLOBAL",
+    "LOAD_NAME",
+    "LOAD_DEREF",
+    "LOAD_CLASSDEREF",
+    "LOAD_FROM_DICT_OR_DEREF",
+    "LOAD_FROM_DICT_OR_GLOBALS",
+}
+DISPATCH_TABLES: dict[tuple[type, type], list[tuple[DSFunc, bool, bool]]] = {}
+LAZY_CLASSES: dict[tuple[type, frozenset[str]], type] = {}
+
+
+def serialize(val: Any) -> Any:  # noqa: ANN401
+    """Convert value to BSON ready structure without copying immutables."""
+    cls = val.__class__
+    if cls in IMMUTABLE_TYPES:
+        return val
+    elif cls is list:
+        return [serialize(v) for v in val]
+    elif cls is dict:
+        return {key: serialize(v) for key, v in val.items()}
+    elif hasattr(cls, "__dataclass_fields__"):
+        return serializer(cls)(val)
+    elif isinstance(val, tuple):
+        items = (serialize(v) for v in val)
+        return cls(*items) if hasattr(val, "_fields") else tuple(items)
+    elif isinstance(val, list):
+        return [serialize(v) for v in val]
+    elif isinstance(val, dict):
+        return {key: serialize(v) for key, v in val.items()}
+    return deepcopy(val)
+
+
+def serializer(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Get or generate dataclass serializer based on its fields and type hints."""
+    if (_serializer := SERIALIZERS.get(cls)) is None:
+        try:
+            hintings = get_type_hints(cls)
+        except (NameError, TypeError):
+            # hints only importable on type checking, serialize fields by value
+            hintings = {}
+        namespace: dict[str, Any] = {
+            "IMMUTABLE_TYPES": IMMUTABLE_TYPES,
+            "serialize": serialize,
+            "serializer": serializer,
+        }
+        items = []
+        for idx, attr in enumerate(fields(cls)):  # type: ignore[arg-type]
+            name = attr.name
+            hint = hintings.get(name)
+            if hint in IMMUTABLE_TYPES:
+                item = f"v if (v := obj.{name}).__class__ in IMMUTABLE_TYPES else serialize(v)"
+            elif is_dataclass(hint):
+                namespace[f"cls{idx}"] = hint
+                item = f"serializer(cls{idx})(v) if (v := obj.{name}).__class__ is cls{idx} else serialize(v)"
+            else:
+                item = f"serialize(obj.{name})"
+            items.append(f"{name!r}: ({item})")
+
+        exec(  # noqa: S102
+            f"def _serializer(obj):\n    return {{{', '.join(items)}}}", namespace
+        )
+        _serializer = SERIALIZERS[cls] = namespace["_serializer"]
+    return _serializer
 
 
 def architype_to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
@@ -61,6 +182,137 @@ def architype_to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object)
     return architype
 
 
+class LazyField:
+    """Hydrate lazy architype on first access of its field."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        """Initialize field descriptor."""
+        self.name = name
+
+    def __get__(self, obj: object, owner: type | None = None) -> Any:  # noqa: ANN401
+        """Hydrate then get field."""
+        if obj is None:
+            return self
+        return getattr(hydrate(obj), self.name)
+
+    def __set__(self, obj: object, value: Any) -> None:  # noqa: ANN401
+        """Hydrate then set field."""
+        setattr(hydrate(obj), self.name, value)
+
+    def __delete__(self, obj: object) -> None:
+        """Hydrate then delete field."""
+        delattr(hydrate(obj), self.name)
+
+
+def lazy_class(cls: type, lazy_fields: frozenset[str]) -> type:
+    """
+    Get or generate subclass of architype whose `lazy_fields` hydrate it on access.
+
+    Hydration switches the instance back to the actual class, so isinstance
+    checks and ability dispatch don't need its data.
+    """
+    if (lazy_cls := LAZY_CLASSES.get((cls, lazy_fields))) is None:
+        lazy_cls = LAZY_CLASSES[(cls, lazy_fields)] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__lazy_fields__": lazy_fields,
+                **{name: LazyField(name) for name in lazy_fields},
+            },
+        )
+    return lazy_cls
+
+
+def lazy_architype(cls: type[T], data: Mapping[str, Any]) -> T:
+    """Create architype that is only parsed from data on first field access."""
+    architype: object = object.__new__(
+        lazy_class(cls, frozenset(attr.name for attr in fields(cls)))  # type: ignore[arg-type]
+    )
+    architype.__dict__["__raw__"] = data
+    return cast(T, architype)
+
+
+def partial_architype(cls: type[T], data: dict[str, Any]) -> T:
+    """Create architype from projected data, other fields are fetched on first access."""
+    lazy_fields = frozenset(
+        attr.name for attr in fields(cls) if attr.name not in data  # type: ignore[arg-type]
+    )
+    if not lazy_fields:
+        return architype_to_dataclass(cls, data)
+
+    _to_dataclass(cls, data)
+    architype: object = object.__new__(lazy_class(cls, lazy_fields))
+    architype.__dict__.update(data)
+    architype.__dict__["__raw__"] = None
+    return cast(T, architype)
+
+
+def is_lazy(architype: object) -> bool:
+    """Check if architype is not yet hydrated."""
+    return "__raw__" in getattr(architype, "__dict__", {})
+
+
+def loaded_fields(architype: object) -> list[str]:
+    """Return field names of architype that are already loaded."""
+    lazy_fields = getattr(architype.__class__, "__lazy_fields__", ())
+    return [
+        attr.name
+        for attr in fields(architype)  # type: ignore[arg-type]
+        if attr.name not in lazy_fields
+    ]
+
+
+def hydrate(architype: T) -> T:
+    """Parse data of lazy architype or fetch fields excluded by projection."""
+    if "__raw__" in architype.__dict__:
+        data = architype.__dict__.pop("__raw__")
+        lazy_cls = architype.__class__
+        cls = lazy_cls.__bases__[0]
+        object.__setattr__(architype, "__class__", cls)
+
+        jac = architype.__dict__.get("__jac__")
+        if data is None:
+            from .context import JaseciContext
+
+            if not isinstance(jac, BaseAnchor) or not (
+                doc := jac.Collection.collection().find_one(
+                    {"_id": jac.id},
+                    {"architype": True},
+                    session=JaseciContext.get().mem.__session__,
+                )
+            ):
+                raise ValueError(f"{cls.__name__} is not a valid reference!")
+            data = doc["architype"]
+
+        parsed: object = architype_to_dataclass(
+            cls, decode(data.raw) if isinstance(data, RawBSONDocument) else dict(data)
+        )
+        lazy_fields = lazy_cls.__lazy_fields__  # type: ignore[attr-defined]
+        for name in lazy_fields:
+            architype.__dict__[name] = parsed.__dict__[name]
+
+        if isinstance(jac, BaseAnchor):
+            jac.sync_hash(lazy_fields)
+    return architype
+
+
+def load_architype(cls: type[T], data: Mapping[str, Any], partial: bool = False) -> T:
+    """
+    Parse architype data.
+
+    `partial` data came from projection and fields it doesn't include are
+    fetched on demand, otherwise parsing is deferred if LAZY_HYDRATION.
+    """
+    if partial:
+        return partial_architype(cls, dict(data))
+    elif LAZY_HYDRATION:
+        return lazy_architype(cls, data)
+    return architype_to_dataclass(cls, cast(dict, data))
+
+
 def to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
     """Parse dict to dataclass."""
     _to_dataclass(cls, data)
@@ -69,26 +321,45 @@ def to_dataclass(cls: type[T], data: dict[str, Any], **kwargs: object) -> T:
 
 def _to_dataclass(cls: type[T], data: dict[str, Any]) -> None:
     """Parse dict to dataclass implementation."""
-    hintings = get_type_hints(cls)
-    if is_dataclass(cls):
-        for attr in fields(cls):
-            if target := data.get(attr.name):
-                hint = hintings[attr.name]
+    for name, origin, inner_cls in decoding_plan(cls):
+        if target := data.get(name):
+            if origin is None:
+                data[name] = to_dataclass(inner_cls, target)
+            elif origin is dict:
+                if isinstance(target, dict):
+                    for key, value in target.items():
+                        target[key] = to_dataclass(inner_cls, value)
+            elif isinstance(target, list):
+                for key, value in enumerate(target):
+                    target[key] = to_dataclass(inner_cls, value)
+
+
+def decoding_plan(cls: type) -> list[tuple[str, type | None, type]]:
+    """
+    Get or build decoding plan of dataclass.
+
+    Each entry consists of field name, container origin (None, dict or list)
+    and the dataclass it needs to be parsed to. Fields that don't need parsing
+    are excluded.
+    """
+    if (plan := DECODING_PLANS.get(cls)) is None:
+        plan = []
+        if is_dataclass(cls):
+            try:
+                hintings = get_type_hints(cls)
+            except (NameError, TypeError):
+                # hints only importable on type checking, fields are kept as is
+                hintings = {}
+            for attr in fields(cls):
+                hint = hintings.get(attr.name)
                 if is_dataclass(hint):
-                    data[attr.name] = to_dataclass(hint, target)
-                else:
-                    origin = get_origin(hint)
-                    if origin == dict and isinstance(target, dict):
-                        if is_dataclass(inner_cls := get_args(hint)[-1]):
-                            for key, value in target.items():
-                                target[key] = to_dataclass(inner_cls, value)
-                    elif (
-                        origin == list
-                        and isinstance(target, list)
-                        and is_dataclass(inner_cls := get_args(hint)[-1])
-                    ):
-                        for key, value in enumerate(target):
-                            target[key] = to_dataclass(inner_cls, value)
+                    plan.append((attr.name, None, cast(type, hint)))
+                elif (origin := get_origin(hint)) in (dict, list) and is_dataclass(
+                    inner_cls := get_args(hint)[-1]
+                ):
+                    plan.append((attr.name, origin, inner_cls))
+        DECODING_PLANS[cls] = plan
+    return plan
 
 
 @dataclass
@@ -103,19 +374,22 @@ class BulkWrite:
     )
 
     operations: dict[
-        type["BaseAnchor"],
+        type,
         list[InsertOne[Any] | DeleteMany | DeleteOne | UpdateMany | UpdateOne],
     ] = field(
         default_factory=lambda: {
             NodeAnchor: [],
             EdgeAnchor: [],
             WalkerAnchor: [],
+            EdgeBucket: [],
         }
     )
 
     del_ops_nodes: list[ObjectId] = field(default_factory=list)
     del_ops_edges: list[ObjectId] = field(default_factory=list)
     del_ops_walker: list[ObjectId] = field(default_factory=list)
+    del_ops_buckets: list[ObjectId] = field(default_factory=list)
+    upd_ops_ids: set[ObjectId] = field(default_factory=set)
 
     def del_node(self, id: ObjectId) -> None:
         """Add node to delete many operations."""
@@ -144,11 +418,76 @@ class BulkWrite:
 
         self.del_ops_walker.append(id)
 
+    def del_buckets(self, node: ObjectId) -> None:
+        """Add node's edge buckets to delete many operations."""
+        if not self.del_ops_buckets:
+            self.operations[EdgeBucket].append(
+                DeleteMany({"node": {"$in": self.del_ops_buckets}})
+            )
+
+        self.del_ops_buckets.append(node)
+
+    def add_edges(self, node: ObjectId, edges: Iterable["EdgeAnchor"]) -> None:
+        """Add edges to node's buckets that still have space."""
+        size = EDGE_BUCKET_SIZE or 1000
+        groups: dict[str | None, list[str | bytes]] = {}
+        for edge in edges:
+            name = edge.name if EDGE_BUCKET_BY_TYPE else None
+            groups.setdefault(name, []).append(edge.stored_ref)
+
+        operations = self.operations[EdgeBucket]
+        for name, refs in groups.items():
+            for idx in range(0, len(refs), size):
+                chunk = refs[idx : idx + size]
+                operations.append(
+                    UpdateOne(
+                        # only buckets with space for the whole chunk, even concurrently
+                        {
+                            "node": node,
+                            "name": name,
+                            "count": {"$lte": size - len(chunk)},
+                        },
+                        {
+                            "$push": {"edges": {"$each": chunk}},
+                            "$inc": {"count": len(chunk)},
+                        },
+                        upsert=True,
+                    )
+                )
+
+    def pull_edges(self, node: ObjectId, edges: Iterable["EdgeAnchor"]) -> None:
+        """Remove edges from node's buckets and delete emptied buckets."""
+        operations = self.operations[EdgeBucket]
+        pulled = False
+        for edge in edges:
+            # edge is stored in one bucket so only its count drops by one
+            refs = edge.stored_refs
+            operations.append(
+                UpdateOne(
+                    {"node": node, "edges": {"$in": refs}},
+                    {"$pull": {"edges": {"$in": refs}}, "$inc": {"count": -1}},
+                )
+            )
+            pulled = True
+
+        if pulled:
+            operations.append(DeleteMany({"node": node, "count": {"$lte": 0}}))
+
     @property
     def has_operations(self) -> bool:
         """Check if has operations."""
         return any(val for val in self.operations.values())
 
+    @property
+    def changed_ids(self) -> set[ObjectId]:
+        """Return ids of existing documents that will be updated or deleted."""
+        return {
+            *self.upd_ops_ids,
+            *self.del_ops_nodes,
+            *self.del_ops_edges,
+            *self.del_ops_walker,
+        }
+
     @staticmethod
     def commit(session: ClientSession) -> None:
         """Commit current session."""
@@ -187,7 +526,10 @@ class BulkWrite:
                     EdgeAnchor.Collection.bulk_write(edge_operation, False, session)
                 if walker_operation := self.operations[WalkerAnchor]:
                     WalkerAnchor.Collection.bulk_write(walker_operation, False, session)
+                if bucket_operation := self.operations[EdgeBucket]:
+                    EdgeBucket.Collection.bulk_write(bucket_operation, True, session)
                 self.commit(session)
+                ANCHOR_CACHE.invalidate(self.changed_ids)
                 break
             except (ConnectionFailure, OperationFailure) as ex:
                 if ex.has_error_label("TransientTransactionError"):
@@ -238,22 +580,321 @@ class Permission(_Permission):
     @classmethod
     def deserialize(cls, data: dict[str, Any]) -> "Permission":
         """Deserialize Permission."""
-        return Permission(
+        permission = Permission(
             all=AccessLevel[data.get("all", AccessLevel.NO_ACCESS.name)],
             roots=Access.deserialize(data.get("roots", {})),
         )
+        if permission == DEFAULT_PERMISSION:
+            return DEFAULT_PERMISSION
+        return permission
 
 
-@dataclass
+class SharedAnchors(dict):
+    """Read-only allowed roots of shared permission."""
+
+    def __readonly__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Prevent changes to shared permission."""
+        raise TypeError("Shared permission is read-only!")
+
+    __setitem__ = __delitem__ = __ior__ = __readonly__  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = __readonly__  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type["SharedAnchors"], tuple[dict]]:
+        """Rebuild without item assignment."""
+        return SharedAnchors, (dict(self),)
+
+
+class SharedPermission(Permission):
+    """
+    Read-only permission shared by anchors until their access is used.
+
+    Anchors hold it through `AnchorPermission` which replaces it with a
+    private copy before exposing it, so it's only read internally.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Prevent changes to shared permission, anchors replace it with a copy."""
+        if name in self.__dict__:
+            raise TypeError("Shared permission is read-only!")
+        object.__setattr__(self, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare as permission."""
+        return (
+            isinstance(other, Permission)
+            and self.all == other.all
+            and self.roots.anchors == other.roots.anchors
+        )
+
+    def __copy__(self) -> "SharedPermission":
+        """Keep single instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "SharedPermission":
+        """Keep single instance."""
+        return self
+
+    def __reduce__(self) -> str:
+        """Unpickle as module's DEFAULT_PERMISSION."""
+        return "DEFAULT_PERMISSION"
+
+
+# flyweight permission of anchors without custom access
+DEFAULT_PERMISSION = SharedPermission(roots=Access(anchors=SharedAnchors()))
+
+
+class AnchorPermission:
+    """Anchor's `access` field that copies shared permission on first read."""
+
+    def __get__(
+        self, anchor: "BaseAnchor | None", owner: type | None = None
+    ) -> Permission:
+        """Return anchor's own permission."""
+        if anchor is None:
+            # no class default, field stays required
+            raise AttributeError("access")
+        try:
+            access = anchor.__dict__["access"]
+        except KeyError:
+            # not yet populated
+            raise AttributeError("access") from None
+        if access is DEFAULT_PERMISSION:
+            access = anchor.__dict__["access"] = Permission()
+        return access
+
+    def __set__(self, anchor: "BaseAnchor", access: Permission) -> None:
+        """Set anchor's permission."""
+        anchor.__dict__["access"] = access
+
+
+class TrackedList(list):
+    """List that flags its architype fields as dirty when mutated."""
+
+    __slots__ = ("__trackers__",)
+    # every anchor field holding it, containers can be shared
+    __trackers__: list[tuple["AnchorState", str]]
+
+    def __mark__(self) -> None:
+        """Flag owner fields as dirty."""
+        for state, name in self.__trackers__:
+            state.mark(name)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:  # noqa: ANN401
+        """Copy/pickle as plain list."""
+        return list, (list(self),)
+
+    def __setitem__(self, key: Any, value: Any) -> None:  # noqa: ANN401
+        """Override list.__setitem__."""
+        self.__mark__()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:  # noqa: ANN401
+        """Override list.__delitem__."""
+        self.__mark__()
+        super().__delitem__(key)
+
+    def __iadd__(self, value: Any) -> "TrackedList":  # type: ignore[override, misc] # noqa: ANN401
+        """Override list.__iadd__."""
+        self.__mark__()
+        return super().__iadd__(value)
+
+    def __imul__(self, value: Any) -> "TrackedList":  # type: ignore[override, misc] # noqa: ANN401
+        """Override list.__imul__."""
+        self.__mark__()
+        return super().__imul__(value)
+
+    def append(self, value: Any) -> None:  # noqa: ANN401
+        """Override list.append."""
+        self.__mark__()
+        super().append(value)
+
+    def extend(self, value: Any) -> None:  # noqa: ANN401
+        """Override list.extend."""
+        self.__mark__()
+        super().extend(value)
+
+    def insert(self, index: Any, value: Any) -> None:  # noqa: ANN401
+        """Override list.insert."""
+        self.__mark__()
+        super().insert(index, value)
+
+    def pop(self, index: Any = -1) -> Any:  # noqa: ANN401
+        """Override list.pop."""
+        self.__mark__()
+        return super().pop(index)
+
+    def remove(self, value: Any) -> None:  # noqa: ANN401
+        """Override list.remove."""
+        self.__mark__()
+        super().remove(value)
+
+    def clear(self) -> None:
+        """Override list.clear."""
+        self.__mark__()
+        super().clear()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Override list.sort."""
+        self.__mark__()
+        super().sort(*args, **kwargs)
+
+    def reverse(self) -> None:
+        """Override list.reverse."""
+        self.__mark__()
+        super().reverse()
+
+
+class TrackedDict(dict):
+    """Dict that flags its architype fields as dirty when mutated."""
+
+    __slots__ = ("__trackers__",)
+    # every anchor field holding it, containers can be shared
+    __trackers__: list[tuple["AnchorState", str]]
+
+    def __mark__(self) -> None:
+        """Flag owner fields as dirty."""
+        for state, name in self.__trackers__:
+            state.mark(name)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:  # noqa: ANN401
+        """Copy/pickle as plain dict."""
+        return dict, (dict(self),)
+
+    def __setitem__(self, key: Any, value: Any) -> None:  # noqa: ANN401
+        """Override dict.__setitem__."""
+        self.__mark__()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:  # noqa: ANN401
+        """Override dict.__delitem__."""
+        self.__mark__()
+        super().__delitem__(key)
+
+    def __ior__(self, value: Any) -> "TrackedDict":  # type: ignore[override, misc] # noqa: ANN401
+        """Override dict.__ior__."""
+        self.__mark__()
+        return super().__ior__(value)
+
+    def pop(self, *args: Any) -> Any:  # noqa: ANN401
+        """Override dict.pop."""
+        self.__mark__()
+        return super().pop(*args)
+
+    def popitem(self) -> Any:  # noqa: ANN401
+        """Override dict.popitem."""
+        self.__mark__()
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Override dict.clear."""
+        self.__mark__()
+        super().clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Override dict.update."""
+        self.__mark__()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Override dict.setdefault."""
+        self.__mark__()
+        return super().setdefault(key, default)
+
+
+def add_tracker(
+    val: TrackedList | TrackedDict, tracker: tuple["AnchorState", str]
+) -> None:
+    """Add owner field to tracked container if not yet tracking it."""
+    state, name = tracker
+    for _state, _name in val.__trackers__:
+        if _state is state and _name == name:
+            return
+    val.__trackers__.append(tracker)
+
+
+def track(
+    val: Any, tracker: tuple["AnchorState", str]  # noqa: ANN401
+) -> tuple[Any, bool]:
+    """
+    Convert list/dict value to tracked container including nested ones.
+
+    Already tracked containers are also tracked by the new owner field.
+    Also returns if every mutation of the value can be tracked.
+    """
+    cls = val.__class__
+    if cls in IMMUTABLE_TYPES:
+        return val, True
+
+    trackable = True
+    if cls is list or cls is TrackedList:
+        if cls is list:
+            val = TrackedList(val)
+            val.__trackers__ = [tracker]
+        else:
+            add_tracker(val, tracker)
+        for idx, v in enumerate(val):
+            if v.__class__ in IMMUTABLE_TYPES:
+                continue
+            _v, _trackable = track(v, tracker)
+            trackable = trackable and _trackable
+            if _v is not v:
+                list.__setitem__(val, idx, _v)
+    elif cls is dict or cls is TrackedDict:
+        if cls is dict:
+            val = TrackedDict(val)
+            val.__trackers__ = [tracker]
+        else:
+            add_tracker(val, tracker)
+        for key, v in val.items():
+            if v.__class__ in IMMUTABLE_TYPES:
+                continue
+            _v, _trackable = track(v, tracker)
+            trackable = trackable and _trackable
+            if _v is not v:
+                dict.__setitem__(val, key, _v)
+    else:
+        trackable = False
+    return val, trackable
+
+
+@dataclass(slots=True)
 class AnchorState:
     """Anchor state handler."""
 
-    changes: dict[str, dict[str, Any]] = field(default_factory=dict)
-    full_hash: int = 0
+    # created on first change
+    changes: dict[str, dict[str, Any]] | None = None
     context_hashes: dict[str, int] = field(default_factory=dict)
+    # architype fields reassigned or mutated (tracked) since last sync
+    dirty: set[str] | None = None
+    # architype has values that may be mutated in place without being tracked
+    mutable: bool = False
     deleted: bool | None = None
     connected: bool = False
 
+    def mark(self, name: str) -> None:
+        """Flag architype field as dirty."""
+        if self.dirty is None:
+            self.dirty = {name}
+        else:
+            self.dirty.add(name)
+
+    def operation(self, op: str) -> dict[str, Any]:
+        """Get or create update operation."""
+        if self.changes is None:
+            self.changes = {}
+        if (operation := self.changes.get(op)) is None:
+            operation = self.changes[op] = {}
+        return operation
+
+
+def interned(anchor: TANC) -> TANC:
+    """Resolve anchor reference to the single instance of its id in current memory."""
+    from .context import JASECI_CONTEXT
+
+    if jctx := JASECI_CONTEXT.get(None):
+        return jctx.mem.intern(anchor)
+    return anchor
+
 
 @dataclass(eq=False, repr=False, kw_only=True)
 class BaseAnchor:
@@ -263,7 +904,7 @@ class BaseAnchor:
     name: str = ""
     id: ObjectId = field(default_factory=ObjectId)
     root: ObjectId | None = None
-    access: Permission
+    access: AnchorPermission = AnchorPermission()
     state: AnchorState
 
     class Collection(BaseCollection["BaseAnchor"]):
@@ -294,7 +935,7 @@ class BaseAnchor:
             anchor = object.__new__(cls)
             anchor.name = str(match.group(2))
             anchor.id = ObjectId(match.group(3))
-            return anchor
+            return interned(anchor)
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
     ####################################################
@@ -303,29 +944,19 @@ class BaseAnchor:
 
     @property
     def _set(self) -> dict:
-        if "$set" not in self.state.changes:
-            self.state.changes["$set"] = {}
-        return self.state.changes["$set"]
+        return self.state.operation("$set")
 
     @property
     def _unset(self) -> dict:
-        if "$unset" not in self.state.changes:
-            self.state.changes["$unset"] = {}
-        return self.state.changes["$unset"]
+        return self.state.operation("$unset")
 
     @property
     def _add_to_set(self) -> dict:
-        if "$addToSet" not in self.state.changes:
-            self.state.changes["$addToSet"] = {}
-
-        return self.state.changes["$addToSet"]
+        return self.state.operation("$addToSet")
 
     @property
     def _pull(self) -> dict:
-        if "$pull" not in self.state.changes:
-            self.state.changes["$pull"] = {}
-
-        return self.state.changes["$pull"]
+        return self.state.operation("$pull")
 
     def add_to_set(self, field: str, anchor: Anchor, remove: bool = False) -> None:
         """Add to set."""
@@ -368,11 +999,12 @@ class BaseAnchor:
     ) -> None:
         """Allow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = self.access.roots
+        access = self.peek_access().roots
         if (ref_id := root.ref_id) and level != access.anchors.get(
             ref_id, AccessLevel.NO_ACCESS
         ):
-            access.anchors[ref_id] = level
+            self.access.roots.anchors[ref_id] = level
+            self.reset_grants()
             self._set.update({f"access.roots.anchors.{ref_id}": level.name})
             self._unset.pop(f"access.roots.anchors.{ref_id}", None)
 
@@ -381,23 +1013,40 @@ class BaseAnchor:
     ) -> None:
         """Disallow all access from target root graph to current Architype."""
         level = AccessLevel.cast(level)
-        access = self.access.roots
+        access = self.peek_access().roots
 
-        if (ref_id := root.ref_id) and access.anchors.pop(ref_id, None) is not None:
+        if (ref_id := root.ref_id) and ref_id in access.anchors:
+            del self.access.roots.anchors[ref_id]
+            self.reset_grants()
             self._unset.update({f"access.roots.anchors.{ref_id}": True})
             self._set.pop(f"access.roots.anchors.{ref_id}", None)
 
+    def peek_access(self) -> Permission:
+        """Return permission without copying shared default, only for reading."""
+        if (access := self.__dict__.get("access")) is None:
+            access = self.access
+        return access
+
+    def reset_grants(self) -> None:
+        """Drop access of root graphs cached in current request."""
+        from .context import JASECI_CONTEXT
+
+        if jctx := JASECI_CONTEXT.get(None):
+            jctx.mem.__grants__.clear()
+
     def unrestrict(self, level: AccessLevel | int | str = AccessLevel.READ) -> None:
         """Allow everyone to access current Architype."""
         level = AccessLevel.cast(level)
-        if level != self.access.all:
+        if level != self.peek_access().all:
             self.access.all = level
+            self.reset_grants()
             self._set.update({"access.all": level.name})
 
     def restrict(self) -> None:
         """Disallow others to access current Architype."""
-        if self.access.all > AccessLevel.NO_ACCESS:
+        if self.peek_access().all > AccessLevel.NO_ACCESS:
             self.access.all = AccessLevel.NO_ACCESS
+            self.reset_grants()
             self._set.update({"access.all": AccessLevel.NO_ACCESS.name})
 
     ####################################################
@@ -472,8 +1121,10 @@ class BaseAnchor:
 
     def update(self, bulk_write: BulkWrite, propagate: bool = False) -> None:
         """Append Update Query."""
-        changes = self.state.changes
-        self.state.changes = {}  # renew reference
+        changes = self.state.changes or {}
+        dirty = self.state.dirty or set()
+        self.state.changes = None  # renew reference
+        self.state.dirty = None
 
         operations = bulk_write.operations[self.__class__]
         operation_filter = {"_id": self.id}
@@ -488,15 +1139,23 @@ class BaseAnchor:
             if is_dataclass(architype := self.architype) and not isinstance(
                 architype, type
             ):
-                for (
-                    key,
-                    val,
-                ) in (
-                    architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
-                ):
-                    if (h := hash(dumps(val))) != self.state.context_hashes.get(key):
-                        self.state.context_hashes[key] = h
-                        set_architype[f"architype.{key}"] = val
+                if CHANGE_TRACKING == "tracked":
+                    self.track_changes(architype, dirty, set_architype)
+                else:
+                    for key, val in (
+                        # only check loaded fields
+                        [
+                            (key, serialize(getattr(architype, key)))
+                            for key in list(self.state.context_hashes)
+                        ]
+                        if is_lazy(architype)
+                        else architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
+                    ):
+                        if (h := hash(dumps(val))) != self.state.context_hashes.get(
+                            key
+                        ):
+                            self.state.context_hashes[key] = h
+                            set_architype[f"architype.{key}"] = val
             if set_architype:
                 changes["$set"] = set_architype
         else:
@@ -505,7 +1164,12 @@ class BaseAnchor:
 
         # -------------------------------------------------------- #
 
-        if isinstance(self, NodeAnchor):
+        if isinstance(self, NodeAnchor) and (
+            self.bucketed
+            or (("$addToSet" in changes or "$pull" in changes) and self.outgrown)
+        ):
+            self.update_buckets(bulk_write, changes, propagate)
+        elif isinstance(self, NodeAnchor):
             ############################################################
             #                   POPULATE ADDED EDGES                   #
             ############################################################
@@ -517,7 +1181,7 @@ class BaseAnchor:
                 for anchor in added_edges:
                     if propagate:
                         anchor.build_query(bulk_write)
-                    _added_edges.append(anchor.ref_id)
+                    _added_edges.append(cast(EdgeAnchor, anchor).stored_ref)
                 changes["$addToSet"]["edges"]["$each"] = _added_edges
             else:
                 changes.pop("$addToSet", None)
@@ -531,16 +1195,17 @@ class BaseAnchor:
                 changes.get("$pull", {}).get("edges", {}).get("$in", [])
             )
             if pulled_edges:
-                _pulled_edges = []
+                _pulled_edges: list[str | bytes] = []
                 for anchor in pulled_edges:
                     if propagate and anchor.state.deleted is not True:
                         anchor.state.deleted = True
                         bulk_write.del_edge(anchor.id)
-                    _pulled_edges.append(anchor.ref_id)
+                    _pulled_edges.extend(cast(EdgeAnchor, anchor).stored_refs)
 
                 if added_edges:
                     # Isolate pull to avoid conflict with addToSet
                     changes.pop("$pull", None)
+                    bulk_write.upd_ops_ids.add(self.id)
                     operations.append(
                         UpdateOne(
                             operation_filter,
@@ -555,6 +1220,7 @@ class BaseAnchor:
             # -------------------------------------------------------- #
 
         if changes:
+            bulk_write.upd_ops_ids.add(self.id)
             operations.append(UpdateOne(operation_filter, changes))
 
     def delete(self, bulk_write: BulkWrite) -> None:
@@ -565,22 +1231,102 @@ class BaseAnchor:
         """Delete Anchor."""
         raise NotImplementedError("destroy must be implemented in subclasses")
 
-    def has_changed(self) -> int:
+    def track_changes(
+        self,
+        architype: Any,  # noqa: ANN401
+        dirty: set[str],
+        set_architype: dict[str, Any],
+    ) -> None:
+        """Populate $set of reassigned/mutated fields and untracked fields with different hash."""
+        context_hashes = self.state.context_hashes
+        for attr in fields(architype):
+            key = attr.name
+            if key in dirty:
+                val = getattr(architype, key)
+                set_architype[f"architype.{key}"] = serialize(val)
+            elif key in context_hashes:
+                val = getattr(architype, key)
+                if (h := hash(dumps(_val := serialize(val)))) != context_hashes[key]:
+                    context_hashes[key] = h
+                    set_architype[f"architype.{key}"] = _val
+                continue
+            else:
+                continue
+
+            _val, trackable = track(val, (self.state, key))
+            if _val is not val:
+                object.__setattr__(architype, key, _val)
+            if trackable:
+                context_hashes.pop(key, None)
+            else:
+                context_hashes[key] = hash(dumps(set_architype[f"architype.{key}"]))
+                self.state.mutable = True
+
+    def has_changed(self) -> bool:
         """Check if needs to update."""
-        if self.state.full_hash != (new_hash := hash(pdumps(self.serialize()))):
-            return new_hash
-        return 0
+        state = self.state
+        if state.dirty or state.changes:
+            return True
+
+        # in place mutations can't be tracked, compare with synced hashes instead
+        if state.mutable:
+            context_hashes = state.context_hashes
+            architype = self.architype
+            if CHANGE_TRACKING == "tracked" or is_lazy(architype):
+                return any(
+                    hash(dumps(serialize(getattr(architype, key)))) != h
+                    for key, h in context_hashes.items()
+                )
+
+            for (
+                key,
+                val,
+            ) in (
+                architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
+            ):
+                if hash(dumps(val)) != context_hashes.get(key):
+                    return True
 
-    def sync_hash(self) -> None:
-        """Sync current serialization hash."""
+        return False
+
+    def sync_hash(self, keys: Iterable[str] | None = None) -> None:
+        """
+        Sync current serialization hash.
+
+        Fields of lazy architype that aren't loaded yet are skipped and synced
+        via `keys` on top of the current hashes once they're loaded.
+        """
         if is_dataclass(architype := self.architype) and not isinstance(
             architype, type
         ):
-            self.state.context_hashes = {
-                key: hash(dumps(val))
-                for key, val in architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
-            }
-            self.state.full_hash = hash(pdumps(self.serialize()))
+            state = self.state
+            context_hashes = {} if keys is None else state.context_hashes
+            mutable = False if keys is None else state.mutable
+            if CHANGE_TRACKING == "tracked":
+                # only hash values that can't be tracked
+                for key in loaded_fields(architype) if keys is None else keys:
+                    val = getattr(architype, key)
+                    _val, trackable = track(val, (state, key))
+                    if _val is not val:
+                        object.__setattr__(architype, key, _val)
+                    if not trackable:
+                        context_hashes[key] = hash(dumps(serialize(_val)))
+                        mutable = True
+            else:
+                for key, val in (
+                    architype.__serialize__().items()  # type:ignore[attr-defined] # mypy issue
+                    if keys is None and not is_lazy(architype)
+                    else [
+                        (key, serialize(getattr(architype, key)))
+                        for key in (loaded_fields(architype) if keys is None else keys)
+                    ]
+                ):
+                    context_hashes[key] = hash(dumps(val))
+                    mutable = mutable or isinstance(val, (list, dict, set))
+            state.context_hashes = context_hashes
+            state.mutable = mutable
+            if keys is None:
+                state.dirty = None
 
     def access_level(self, to: Anchor) -> AccessLevel:
         """Access validation."""
@@ -602,18 +1348,18 @@ class BaseAnchor:
         access_level = AccessLevel.NO_ACCESS
 
         # if target anchor have set access.all
-        if (to_access := to.access).all > AccessLevel.NO_ACCESS:
+        if (
+            to_access := cast(BaseAnchor, to).peek_access()
+        ).all > AccessLevel.NO_ACCESS:
             access_level = to_access.all
 
         # if target anchor's root have set allowed roots
         # if current root is allowed to the whole graph of target anchor's root
-        if to.root and isinstance(
-            to_root := jctx.mem.find_by_id(NodeAnchor.ref(f"n::{to.root}")), Anchor
-        ):
-            if to_root.access.all > access_level:
-                access_level = to_root.access.all
+        if to.root:
+            root_all, level = jctx.mem.root_access(jroot, cast(ObjectId, to.root))
+            if root_all > access_level:
+                access_level = root_all
 
-            level = to_root.access.roots.check(jroot.ref_id)
             if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
                 access_level = level
 
@@ -644,7 +1390,7 @@ class BaseAnchor:
             "_id": self.id,
             "name": self.name,
             "root": self.root,
-            "access": self.access.serialize(),
+            "access": self.peek_access().serialize(),
             "architype": (
                 self.architype.__serialize__()  # type:ignore[attr-defined] # mypy issue
                 if is_dataclass(self.architype) and not isinstance(self.architype, type)
@@ -672,33 +1418,49 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
 
     architype: "NodeArchitype"
     edges: list["EdgeAnchor"]
+    # edges are stored in EdgeBucket documents and loaded lazily
+    bucketed: bool = False
 
     class Collection(BaseCollection["NodeAnchor"]):
         """NodeAnchor collection interface."""
 
         __collection__: str | None = "node"
+        __codec_options__: CodecOptions | None = (
+            RAW_CODEC_OPTIONS if LAZY_HYDRATION else None
+        )
+        # fields always included on projected loads
+        __anchor_fields__: list[str] = ["name", "root", "access", "edges", "bucketed"]
         __default_indexes__: list[dict] = [
             {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
         ]
 
+        @classmethod
+        def __dynamic_indexes__(cls) -> list[dict]:
+            """Return indexes declared by node architypes."""
+            return architype_indexes(NodeArchitype)
+
         @classmethod
         def __document__(cls, doc: Mapping[str, Any]) -> "NodeAnchor":
             """Parse document to NodeAnchor."""
-            doc = cast(dict, doc)
+            doc = cast(dict, doc) if doc.__class__ is dict else dict(doc)
 
-            architype = architype_to_dataclass(
+            architype = load_architype(
                 NodeArchitype.__get_class__(doc.get("name") or "Root"),
-                doc.pop("architype"),
+                doc.pop("architype", {}),
+                doc.pop("__partial__", False),
             )
             anchor = NodeAnchor(
                 architype=architype,
                 id=doc.pop("_id"),
                 edges=[e for edge in doc.pop("edges") if (e := EdgeAnchor.ref(edge))],
+                bucketed=doc.pop("bucketed", False),
                 access=Permission.deserialize(doc.pop("access")),
                 state=AnchorState(connected=True),
                 persistent=True,
                 **doc,
             )
+            if anchor.bucketed:
+                del anchor.edges
             architype.__jac__ = anchor
             anchor.sync_hash()
             return anchor
@@ -710,7 +1472,7 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
-            return anchor
+            return interned(anchor)
         raise ValueError(f"[{ref_id}] is not a valid reference!")
 
     def insert(
@@ -721,7 +1483,11 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
         for edge in self.edges:
             edge.build_query(bulk_write)
 
+        if self.outgrown:
+            self.bucketed = True
         bulk_write.operations[NodeAnchor].append(InsertOne(self.serialize()))
+        if self.bucketed:
+            bulk_write.add_edges(self.id, self.edges)
 
     def delete(self, bulk_write: BulkWrite) -> None:
         """Append Delete Query."""
@@ -733,6 +1499,116 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
             edge.delete(bulk_write)
 
         bulk_write.del_node(self.id)
+        if self.bucketed:
+            bulk_write.del_buckets(self.id)
+
+    @property
+    def outgrown(self) -> bool:
+        """Check if inline edges exceeded EDGE_BUCKET_SIZE and should be bucketed."""
+        return not self.bucketed and 0 < EDGE_BUCKET_SIZE < len(self.edges)
+
+    def __getattr__(self, name: str) -> object:
+        """Load bucketed edges on first access."""
+        if name == "edges" and self.__dict__.get("bucketed"):
+            self.edges = self.load_edges()
+            return self.edges
+        return super().__getattr__(name)
+
+    def load_edges(self) -> list["EdgeAnchor"]:
+        """Load edges from buckets including unsaved changes."""
+        from .context import JaseciContext
+
+        if (anchor := JaseciContext.get().mem.find_by_id(self)) and anchor is not self:
+            # share list with the anchor from memory
+            return anchor.edges
+
+        edges: dict[ObjectId, EdgeAnchor] = {}
+        for bucket in EdgeBucket.Collection.find({"node": self.id}, {"edges": True}):
+            for ref in bucket["edges"]:
+                edge = EdgeAnchor.ref(ref)
+                edges[edge.id] = edge
+
+        return self.with_edge_changes(edges)
+
+    def load_directed_edges(self, dir: EdgeDir) -> list["EdgeAnchor"]:
+        """Load edges of one direction from edge collection including unsaved changes."""
+        from .context import JaseciContext
+
+        edges = {
+            edge.id: edge for edge in JaseciContext.get().mem.find_edges(self, dir)
+        }
+        return self.with_edge_changes(edges)
+
+    def with_edge_changes(
+        self, edges: dict[ObjectId, "EdgeAnchor"]
+    ) -> list["EdgeAnchor"]:
+        """Apply unsaved connected and disconnected edges to loaded edges."""
+        changes = self.state.changes or {}
+        for edge in changes.get("$addToSet", {}).get("edges", {}).get("$each", []):
+            edges[edge.id] = edge
+        for edge in changes.get("$pull", {}).get("edges", {}).get("$in", []):
+            edges.pop(edge.id, None)
+
+        return list(edges.values())
+
+    def has_edges(self) -> bool:
+        """Check if node still has edges without loading bucketed edges."""
+        if "edges" in self.__dict__ or not self.__dict__.get("bucketed"):
+            return bool(self.edges)
+
+        changes = self.state.changes or {}
+        if changes.get("$addToSet", {}).get("edges", {}).get("$each"):
+            return True
+
+        pulled = [
+            ref
+            for edge in changes.get("$pull", {}).get("edges", {}).get("$in", [])
+            for ref in edge.stored_refs
+        ]
+        return (
+            EdgeBucket.Collection.find_one(
+                {"node": self.id, "edges": {"$elemMatch": {"$nin": pulled}}},
+                {"_id": True},
+            )
+            is not None
+        )
+
+    def append_edge(self, edge: "EdgeAnchor") -> None:
+        """Append edge without loading bucketed edges."""
+        if "edges" in self.__dict__ or not self.__dict__.get("bucketed"):
+            self.edges.append(edge)
+
+    def remove_edge(self, edge: "EdgeAnchor") -> None:  # type: ignore[override]
+        """Remove edge without loading bucketed edges."""
+        if "edges" in self.__dict__ or not self.__dict__.get("bucketed"):
+            super().remove_edge(edge)
+
+    def update_buckets(
+        self, bulk_write: BulkWrite, changes: dict[str, Any], propagate: bool
+    ) -> None:
+        """Append edge changes as bucket queries, moves inline edges to buckets first."""
+        added_edges: set[EdgeAnchor] = (
+            changes.pop("$addToSet", {}).get("edges", {}).get("$each", [])
+        )
+        pulled_edges: set[EdgeAnchor] = (
+            changes.pop("$pull", {}).get("edges", {}).get("$in", [])
+        )
+
+        if propagate:
+            for anchor in added_edges:
+                anchor.build_query(bulk_write)
+            for anchor in pulled_edges:
+                if anchor.state.deleted is not True:
+                    anchor.state.deleted = True
+                    bulk_write.del_edge(anchor.id)
+
+        if self.bucketed:
+            bulk_write.add_edges(self.id, added_edges)
+            bulk_write.pull_edges(self.id, pulled_edges)
+        else:
+            self.bucketed = True
+            changes.setdefault("$set", {}).update({"edges": [], "bucketed": True})
+            bulk_write.add_edges(self.id, self.edges)
 
     def destroy(self) -> None:
         """Delete Anchor."""
@@ -749,18 +1625,67 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
                     edge.destroy()
                 jctx.mem.remove(self.id)
 
-    def get_edges(
+    def connections(
         self,
         dir: EdgeDir,
         filter_func: Callable[[list["EdgeArchitype"]], list["EdgeArchitype"]] | None,
         target_obj: list["NodeArchitype"] | None,
-    ) -> list["EdgeArchitype"]:
-        """Get edges connected to this node."""
+    ) -> Generator[tuple["EdgeAnchor", "NodeAnchor"], None, None]:
+        """Get accessible edges and their other end node that matches filter."""
         from .context import JaseciContext
 
-        JaseciContext.get().mem.populate_data(self.edges)
+        jctx = JaseciContext.get()
+        if (
+            dir != EdgeDir.ANY
+            and self.__dict__.get("bucketed")
+            and "edges" not in self.__dict__
+        ):
+            # skip loading every bucket of hub nodes, edges are loaded anyway
+            edges = self.load_directed_edges(dir)
+        else:
+            edges = self.edges
+        if filter_func:
+            edges = type_filtered(edges, filter_func)
+        jctx.mem.populate_data(edges)
+
+        root = jctx.root
+        jctx.mem.check_roots(
+            root, (node for edge in edges for node in (edge.source, edge.target))
+        )
+        for anchor in edges:
+            if (
+                (source := anchor.source)
+                and (target := anchor.target)
+                and (not filter_func or filter_func([anchor.architype]))
+                and source.architype
+                and target.architype
+            ):
+                if (
+                    dir in [EdgeDir.OUT, EdgeDir.ANY]
+                    and self == source
+                    and (not target_obj or target.architype in target_obj)
+                    and root.has_read_access(target)
+                ):
+                    yield anchor, target
+                if (
+                    dir in [EdgeDir.IN, EdgeDir.ANY]
+                    and self == target
+                    and (not target_obj or source.architype in target_obj)
+                    and root.has_read_access(source)
+                ):
+                    yield anchor, source
 
-        return super().get_edges(dir, filter_func, target_obj)
+    def get_edges(
+        self,
+        dir: EdgeDir,
+        filter_func: Callable[[list["EdgeArchitype"]], list["EdgeArchitype"]] | None,
+        target_obj: list["NodeArchitype"] | None,
+    ) -> list["EdgeArchitype"]:
+        """Get edges connected to this node."""
+        return [
+            anchor.architype
+            for anchor, _ in self.connections(dir, filter_func, target_obj)
+        ]
 
     def edges_to_nodes(
         self,
@@ -769,20 +1694,185 @@ class NodeAnchor(BaseAnchor, _NodeAnchor):  # type: ignore[misc]
         target_obj: list["NodeArchitype"] | None,
     ) -> list["NodeArchitype"]:
         """Get set of nodes connected to this node."""
-        from .context import JaseciContext
+        return [
+            node.architype for _, node in self.connections(dir, filter_func, target_obj)
+        ]
 
-        JaseciContext.get().mem.populate_data(self.edges)
+    def edges_query(
+        self, dir: EdgeDir = EdgeDir.ANY, name: str | None = None
+    ) -> dict[str, Any]:
+        """Build edge collection filter of this node's edges based on direction."""
+        ref_id = self.ref_id
+
+        query: dict[str, Any] = {}
+        if dir == EdgeDir.OUT:
+            query["source"] = ref_id
+        elif dir == EdgeDir.IN:
+            query["target"] = ref_id
+        else:
+            query["$or"] = [{"source": ref_id}, {"target": ref_id}]
+        if name is not None:
+            query["name"] = name
+        return query
 
-        return super().edges_to_nodes(dir, filter_func, target_obj)
+    def edge_pages(
+        self,
+        dir: EdgeDir = EdgeDir.OUT,
+        name: str | None = None,
+        page_size: int = 100,
+        limit: int = 0,
+    ) -> Generator[list[tuple["EdgeArchitype", "NodeArchitype"]], None, None]:
+        """
+        Stream saved edges and their other end node in pages from datasource.
+
+        Node's `edges` are never loaded so hub nodes can be processed
+        incrementally. Pages are fetched by _id order and filtered by edge
+        name if specified. Total edges is capped by `limit` if not 0.
+        """
+        from .context import JaseciContext
+
+        jctx = JaseciContext.get()
+        mem = jctx.mem
+        root = jctx.root
+        query = self.edges_query(dir, name)
+
+        fetched = 0
+        while not limit or fetched < limit:
+            size = min(page_size, limit - fetched) if limit else page_size
+            docs = list(
+                EdgeAnchor.Collection.find(
+                    query,
+                    sort=[("_id", ASCENDING)],
+                    limit=size,
+                    session=mem.__session__,
+                )
+            )
+            if count := len(docs):
+                query["_id"] = {"$gt": docs[-1].id}
+
+            edges = [mem.adopt(edge) for edge in docs if edge not in mem.__gc__]
+            fetched += count
+
+            nodes = [
+                edge.target if edge.source.id == self.id else edge.source
+                for edge in edges
+            ]
+            mem.populate_anchors(nodes)
+            mem.check_roots(root, nodes)
+            if page := [
+                (edge.architype, node.architype)
+                for edge, node in zip(edges, nodes)
+                if node.architype and root.has_read_access(node)
+            ]:
+                yield page
+
+            if count < size:
+                break
 
     def serialize(self) -> dict[str, object]:
         """Serialize Node Anchor."""
+        if self.bucketed:
+            return {**super().serialize(), "edges": [], "bucketed": True}
         return {
             **super().serialize(),
-            "edges": [edge.ref_id for edge in self.edges],
+            "edges": [edge.stored_ref for edge in self.edges],
         }
 
 
+class UnresolvedFilterError(Exception):
+    """Filter needs actual edge data."""
+
+
+def edge_probe(cls: type) -> Any:  # noqa: ANN401
+    """
+    Get or create edge architype stand-in that only exposes its class.
+
+    Jac edge filters are compiled to `[i for i in x if isinstance(i, T) and i.attr ...]`
+    so any other attribute access or comparison means the filter can't be decided
+    by type.
+    """
+    if (probe := EDGE_PROBES.get(cls)) is None:
+
+        def __getattribute__(self: object, name: str) -> object:  # noqa: N807
+            if name == "__class__":
+                return cls
+            raise UnresolvedFilterError(name)
+
+        def unresolved(*args: Any) -> NoReturn:  # noqa: ANN401
+            raise UnresolvedFilterError()
+
+        namespace: dict[str, Any] = dict.fromkeys(PROBE_UNRESOLVED, unresolved)
+        namespace["__getattribute__"] = __getattribute__
+        probe = EDGE_PROBES[cls] = object.__new__(
+            type(f"{cls.__name__}Probe", (), namespace)
+        )
+    return probe
+
+
+def type_checked(func: Callable) -> bool:
+    """
+    Check if filter only uses `isinstance` and architype classes.
+
+    Probes can't pass checks that bypass `__getattribute__` such as `type(i) is T`,
+    `i is x` or helper calls so filters that may use them are never pre-filtered.
+    """
+    if (code := getattr(func, "__code__", None)) is None:
+        return False
+    if (checked := TYPE_CHECKED_FILTERS.get(code)) is not None:
+        return checked
+
+    scope: dict[str, Any] = {**vars(builtins), **getattr(func, "__globals__", {})}
+    for name, cell in zip(code.co_freevars, getattr(func, "__closure__", None) or ()):
+        with suppress(ValueError):
+            scope[name] = cell.cell_contents
+
+    checked = True
+    codes = [code]
+    while codes and checked:
+        current = codes.pop()
+        codes.extend(c for c in current.co_consts if isinstance(c, CodeType))
+        for instr in get_instructions(current):
+            if instr.opname in ("IS_OP", "CONTAINS_OP"):
+                checked = False
+                break
+            if instr.opname in LOAD_SCOPED:
+                val = scope.get(instr.argval)
+                if not (
+                    val is isinstance
+                    or (isinstance(val, type) and issubclass(val, Architype))
+                ):
+                    checked = False
+                    break
+
+    if not code.co_freevars:
+        # closures may resolve differently per call
+        TYPE_CHECKED_FILTERS[code] = checked
+    return checked
+
+
+def type_filtered(
+    edges: list["EdgeAnchor"],
+    filter_func: Callable[[list["EdgeArchitype"]], list["EdgeArchitype"]],
+) -> list["EdgeAnchor"]:
+    """Exclude edges whose architype name doesn't pass filter's type check."""
+    if not type_checked(filter_func):
+        return edges
+
+    excluded: dict[str, bool] = {}
+    filtered = []
+    for edge in edges:
+        if (exclude := excluded.get(edge.name)) is None:
+            exclude = False
+            cls = EdgeArchitype.__get_class__(edge.name or "GenericEdge")
+            if cls is not EdgeArchitype:
+                with suppress(Exception):
+                    exclude = not filter_func([edge_probe(cls)])
+            excluded[edge.name] = exclude
+        if not exclude:
+            filtered.append(edge)
+    return filtered
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
     """Edge Anchor."""
@@ -796,17 +1886,38 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
         """EdgeAnchor collection interface."""
 
         __collection__: str | None = "edge"
+        __codec_options__: CodecOptions | None = (
+            RAW_CODEC_OPTIONS if LAZY_HYDRATION else None
+        )
+        # fields always included on projected loads
+        __anchor_fields__: list[str] = [
+            "name",
+            "root",
+            "access",
+            "source",
+            "target",
+            "is_undirected",
+        ]
         __default_indexes__: list[dict] = [
-            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]}
+            {"keys": [("_id", ASCENDING), ("name", ASCENDING), ("root", ASCENDING)]},
+            # also serves source / target only queries via prefix
+            {"keys": [("source", ASCENDING), ("name", ASCENDING)]},
+            {"keys": [("target", ASCENDING), ("name", ASCENDING)]},
         ]
 
+        @classmethod
+        def __dynamic_indexes__(cls) -> list[dict]:
+            """Return indexes declared by edge architypes."""
+            return architype_indexes(EdgeArchitype)
+
         @classmethod
         def __document__(cls, doc: Mapping[str, Any]) -> "EdgeAnchor":
             """Parse document to EdgeAnchor."""
-            doc = cast(dict, doc)
-            architype = architype_to_dataclass(
+            doc = cast(dict, doc) if doc.__class__ is dict else dict(doc)
+            architype = load_architype(
                 EdgeArchitype.__get_class__(doc.get("name") or "GenericEdge"),
-                doc.pop("architype"),
+                doc.pop("architype", {}),
+                doc.pop("__partial__", False),
             )
             anchor = EdgeAnchor(
                 architype=architype,
@@ -828,15 +1939,38 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
         pass
 
     @classmethod
-    def ref(cls, ref_id: str) -> "EdgeAnchor":
+    def ref(cls, ref_id: str | bytes) -> "EdgeAnchor":
         """Return EdgeAnchor instance if existing."""
-        if match := EDGE_ID_REGEX.search(ref_id):
+        if isinstance(ref_id, bytes):
+            anchor = object.__new__(cls)
+            anchor.name = EdgeType.name(int.from_bytes(ref_id[:2], "big"))
+            anchor.id = ObjectId(ref_id[2:])
+            return interned(anchor)
+        elif match := EDGE_ID_REGEX.search(ref_id):
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
-            return anchor
+            return interned(anchor)
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
+    @property
+    def stored_ref(self) -> str | bytes:
+        """
+        Return reference stored on node's edges.
+
+        `compact` EDGE_REF_FORMAT uses 2 bytes type code + 12 bytes ObjectId.
+        """
+        if EDGE_REF_FORMAT == "compact":
+            return EdgeType.code(self.name).to_bytes(2, "big") + self.id.binary
+        return self.ref_id
+
+    @property
+    def stored_refs(self) -> list[str | bytes]:
+        """Return every format this reference may still be stored as."""
+        if EDGE_REF_FORMAT == "compact":
+            return [self.stored_ref, self.ref_id]
+        return [self.ref_id]
+
     def insert(self, bulk_write: BulkWrite) -> None:
         """Append Insert Query."""
         if source := self.source:
@@ -886,15 +2020,76 @@ class EdgeAnchor(BaseAnchor, _EdgeAnchor):  # type: ignore[misc]
         }
 
 
+class EdgeBucket:
+    """Chunk of node's edge refs stored outside of the node document."""
+
+    class Collection(BaseCollection[dict]):
+        """EdgeBucket collection interface."""
+
+        __collection__: str | None = "edge_bucket"
+        __default_indexes__: list[dict] = [
+            {"keys": [("node", ASCENDING), ("name", ASCENDING), ("count", ASCENDING)]},
+            {"keys": [("node", ASCENDING), ("edges", ASCENDING)]},
+        ]
+
+
+class EdgeType:
+    """Interned edge architype names used as type codes of compact edge refs."""
+
+    __codes__: dict[str, int] = {}
+    __names__: dict[int, str] = {}
+
+    class Collection(BaseCollection[dict]):
+        """EdgeType collection interface."""
+
+        __collection__: str | None = "edge_type"
+        __default_indexes__: list[dict] = [
+            {"keys": [("name", ASCENDING)], "unique": True}
+        ]
+
+    @classmethod
+    def cache(cls, doc: dict) -> int:
+        """Cache code and name pair."""
+        cls.__codes__[doc["name"]] = doc["_id"]
+        cls.__names__[doc["_id"]] = doc["name"]
+        return doc["_id"]
+
+    @classmethod
+    def code(cls, name: str) -> int:
+        """Get or assign code of edge name."""
+        if (code := cls.__codes__.get(name)) is not None:
+            return code
+
+        while not (doc := cls.Collection.find_one({"name": name})):
+            last = cls.Collection.find_one({}, sort=[("_id", DESCENDING)])
+            # concurrent assignment may take the same code, just retry
+            with suppress(DuplicateKeyError):
+                cls.Collection.insert_one(
+                    {"_id": last["_id"] + 1 if last else 0, "name": name}
+                )
+        return cls.cache(doc)
+
+    @classmethod
+    def name(cls, code: int) -> str:
+        """Get edge name of code."""
+        if (name := cls.__names__.get(code)) is not None:
+            return name
+
+        if not (doc := cls.Collection.find_one({"_id": code})):
+            raise ValueError(f"[{code}] is not a valid edge type code!")
+        cls.cache(doc)
+        return doc["name"]
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
     """Walker Anchor."""
 
     architype: "WalkerArchitype"
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)  # type: ignore[assignment]
     returns: list[Any] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    ignores: set[Anchor] = field(default_factory=set)  # type: ignore[assignment]
     disengaged: bool = False
 
     class Collection(BaseCollection["WalkerAnchor"]):
@@ -932,7 +2127,7 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
             anchor = object.__new__(cls)
             anchor.name = str(match.group(1))
             anchor.id = ObjectId(match.group(2))
-            return anchor
+            return interned(anchor)
         raise ValueError(f"{ref_id}] is not a valid reference!")
 
     def insert(
@@ -957,51 +2152,91 @@ class WalkerAnchor(BaseAnchor, _WalkerAnchor):  # type: ignore[misc]
                 self.state.deleted = False
                 jctx.mem.remove(self.id)
 
+    def visit_node(self, anchors: Iterable[_NodeAnchor | _EdgeAnchor]) -> bool:
+        """Walker visits node."""
+        before_len = len(self.next)
+        for anchor in anchors:
+            if anchor not in self.ignores:
+                if isinstance(anchor, _NodeAnchor):
+                    self.next.append(anchor)
+                elif isinstance(anchor, _EdgeAnchor):
+                    if target := anchor.target:
+                        self.next.append(target)
+                    else:
+                        raise ValueError("Edge has no target.")
+        return len(self.next) > before_len
+
+    def ignore_node(self, anchors: Iterable[_NodeAnchor | _EdgeAnchor]) -> bool:
+        """Walker ignores node."""
+        before_len = len(self.ignores)
+        for anchor in anchors:
+            if isinstance(anchor, _NodeAnchor):
+                self.ignores.add(anchor)
+            elif isinstance(anchor, _EdgeAnchor):
+                if target := anchor.target:
+                    self.ignores.add(target)
+                else:
+                    raise ValueError("Edge has no target.")
+        return len(self.ignores) > before_len
+
     def spawn_call(self, node: Anchor) -> "WalkerArchitype":
         """Invoke data spatial call."""
         if walker := self.architype:
             self.path = []
-            self.next = [node]
+            self.next = deque([node])
             self.returns = []
-            while len(self.next):
-                if current_node := self.next.pop(0).architype:
-                    for i in current_node._jac_entry_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(current_node, walker))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_entry_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(walker, current_node))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_exit_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(walker, current_node))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in current_node._jac_exit_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                self.returns.append(i.func(current_node, walker))
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+            while self.next:
+                if not self.next[0].is_populated():
+                    from .context import JaseciContext
+
+                    # load whole frontier instead of one query per anchor
+                    JaseciContext.get().mem.populate_anchors(self.next)
+
+                if current_node := self.next.popleft().architype:
+                    for i, walker_first, triggered in dispatch_table(
+                        walker.__class__, current_node.__class__
+                    ):
+                        if not triggered:
+                            pass
+                        elif not i.func:
+                            raise ValueError(f"No function {i.name} to call.")
+                        elif walker_first:
+                            self.returns.append(i.func(walker, current_node))
+                        else:
+                            self.returns.append(i.func(current_node, walker))
                         if self.disengaged:
                             return walker
-            self.ignores = []
+            self.ignores = set()
             return walker
         raise Exception(f"Invalid Reference {self.id}")
 
 
+def dispatch_table(walker_cls: type, node_cls: type) -> list[tuple[DSFunc, bool, bool]]:
+    """
+    Get or build ordered abilities to check when walker visits node.
+
+    Order: node entries, walker entries, walker exits then node exits. Each
+    entry also flags if ability is called with walker as first argument and
+    if it's triggered. Non triggered abilities are excluded except the very
+    first one as disengaged walkers stop right after it.
+    Tables are cleared whenever abilities are (re)registered.
+    """
+    if (table := DISPATCH_TABLES.get((walker_cls, node_cls))) is None:
+        table = []
+        for funcs, walker_first, trigger_cls in (
+            (getattr(node_cls, "_jac_entry_funcs_", []), False, walker_cls),
+            (getattr(walker_cls, "_jac_entry_funcs_", []), True, node_cls),
+            (getattr(walker_cls, "_jac_exit_funcs_", []), True, node_cls),
+            (getattr(node_cls, "_jac_exit_funcs_", []), False, walker_cls),
+        ):
+            for i in funcs:
+                triggered = not i.trigger or issubclass(trigger_cls, i.trigger)
+                if triggered or not table:
+                    table.append((i, walker_first, triggered))
+        DISPATCH_TABLES[(walker_cls, node_cls)] = table
+    return table
+
+
 @dataclass(eq=False, repr=False, kw_only=True)
 class ObjectAnchor(BaseAnchor, Anchor):  # type: ignore[misc]
     """Object Anchor."""
@@ -1015,10 +2250,18 @@ class BaseArchitype:
 
     __jac__: Anchor
 
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Flag anchor as dirty when architype attribute is reassigned."""
+        object.__setattr__(self, name, value)
+        if name != "__jac__" and isinstance(
+            jac := self.__dict__.get("__jac__"), BaseAnchor
+        ):
+            jac.state.mark(name)
+
     def __serialize__(self) -> dict[str, Any]:
         """Process default serialization."""
         if is_dataclass(self) and not isinstance(self, type):
-            return asdict(self)
+            return serializer(type(self))(self)
         raise ValueError(
             f"{self.__jac__.__class__.__name__} {self.__class__.__name__} is not serializable!"
         )
@@ -1050,6 +2293,48 @@ class BaseArchitype:
         return jac_class
 
 
+def architype_indexes(base: type[BaseArchitype]) -> list[dict]:
+    """
+    Build partial indexes declared via `__specs__.indexes` of base's subclasses.
+
+    Each declaration is a field name, a list of field names / (field, direction)
+    for compound index, or IndexModel kwargs with `keys` of the same format.
+    Indexes are filtered by architype name so only its documents are indexed.
+    Fields are prefixed by `root` as find_architypes is scoped to a root,
+    except for unique indexes whose uniqueness is across every root.
+    """
+    indexes: dict[str, dict] = {}
+    queue = base.__subclasses__()
+    while queue:
+        cls = queue.pop(-1)
+        queue.extend(cls.__subclasses__())
+
+        for idx in getattr(getattr(cls, "__specs__", None), "indexes", None) or []:
+            idx = dict(idx) if isinstance(idx, dict) else {"keys": idx}
+            keys = [idx["keys"]] if isinstance(idx["keys"], str) else idx["keys"]
+            keys = [
+                (
+                    (f"architype.{key}", ASCENDING)
+                    if isinstance(key, str)
+                    else (f"architype.{key[0]}", key[1])
+                )
+                for key in keys
+            ]
+            if not idx.get("unique"):
+                keys.insert(0, ("root", ASCENDING))
+            name = "_".join([cls.__name__, *(f"{k}_{d}" for k, d in keys)])
+            indexes[name] = {
+                "name": name,
+                **idx,
+                "keys": keys,
+                "partialFilterExpression": {
+                    **idx.get("partialFilterExpression", {}),
+                    "name": cls.__name__,
+                },
+            }
+    return list(indexes.values())
+
+
 class NodeArchitype(BaseArchitype, _NodeArchitype):
     """Node Architype Protocol."""
 
@@ -1061,7 +2346,7 @@ class NodeArchitype(BaseArchitype, _NodeArchitype):
             architype=self,
             name=self.__class__.__name__,
             edges=[],
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
 
@@ -1089,11 +2374,11 @@ class EdgeArchitype(BaseArchitype, _EdgeArchitype):
             source=source,
             target=target,
             is_undirected=is_undirected,
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
-        source.edges.append(jac)
-        target.edges.append(jac)
+        source.append_edge(jac)
+        target.append_edge(jac)
         source.connect_edge(jac)
         target.connect_edge(jac)
 
@@ -1113,7 +2398,7 @@ class WalkerArchitype(BaseArchitype, _WalkerArchitype):
         self.__jac__ = WalkerAnchor(
             architype=self,
             name=self.__class__.__name__,
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
 
@@ -1133,7 +2418,7 @@ class ObjectArchitype(BaseArchitype, Architype):
         self.__jac__ = ObjectAnchor(
             architype=self,
             name=self.__class__.__name__,
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
 
@@ -1157,11 +2442,11 @@ class GenericEdge(EdgeArchitype):
             source=source,
             target=target,
             is_undirected=is_undirected,
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
-        source.edges.append(jac)
-        target.edges.append(jac)
+        source.append_edge(jac)
+        target.append_edge(jac)
         source.connect_edge(jac)
         target.connect_edge(jac)
 
@@ -1178,6 +2463,6 @@ class Root(NodeArchitype):
         self.__jac__ = NodeAnchor(
             architype=self,
             edges=[],
-            access=Permission(),
+            access=DEFAULT_PERMISSION,
             state=AnchorState(),
         )
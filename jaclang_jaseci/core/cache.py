@@ -0,0 +1,215 @@
+"""Shared anchor cache for jaseci plugin."""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from math import inf
+from os import getenv
+from threading import Lock
+from time import monotonic
+from typing import Generator, Iterable, TypeVar
+
+from bson import ObjectId, decode, encode
+from bson.codec_options import CodecOptions, DEFAULT_CODEC_OPTIONS
+
+from pymongo.client_session import ClientSession
+
+from redis.client import PubSubWorkerThread
+
+from ..jaseci.datasources import AnchorRedis, Collection
+
+ANCHOR_CACHE_SIZE = int(getenv("ANCHOR_CACHE_SIZE") or "0")
+ANCHOR_CACHE_TTL = float(getenv("ANCHOR_CACHE_TTL") or "60")
+ANCHOR_CACHE_REDIS = getenv("ANCHOR_CACHE_REDIS") == "true"
+T = TypeVar("T")
+
+
+@dataclass
+class AnchorCache:
+    """
+    Process-wide anchor document cache.
+
+    Documents are stored as raw BSON so every request decodes its own copy
+    and never shares mutable anchors with other requests.
+    If `redis` is enabled, AnchorRedis is used as second tier shared by all
+    workers and invalidations are broadcasted to every worker's first tier.
+    If `redis` is enabled, pinned documents are always cached regardless of
+    `size` and are only reloaded once invalidated. Without redis, other
+    workers' updates can't be received so nothing is pinned.
+    """
+
+    size: int = ANCHOR_CACHE_SIZE
+    ttl: float = ANCHOR_CACHE_TTL
+    redis: bool = ANCHOR_CACHE_REDIS
+
+    __docs__: OrderedDict[ObjectId, tuple[float, bytes]] = field(
+        default_factory=OrderedDict
+    )
+    __pinned__: dict[ObjectId, tuple[float, bytes] | None] = field(default_factory=dict)
+    __epoch__: int = 0
+    __lock__: Lock = field(default_factory=Lock)
+    __listener__: PubSubWorkerThread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if cache is enabled."""
+        return self.size > 0 or self.redis
+
+    @property
+    def epoch(self) -> int:
+        """Return current invalidation epoch."""
+        return self.__epoch__
+
+    def listen(self) -> None:
+        """Subscribe to invalidations from other workers if not yet subscribed."""
+        if self.redis and (self.size > 0 or self.__pinned__) and not self.__listener__:
+            with self.__lock__:
+                if self.__listener__ is None:
+                    self.__listener__ = AnchorRedis.subscribe(
+                        lambda ids: self.forget(ObjectId(id) for id in ids)
+                    )
+
+    def get(self, id: ObjectId) -> bytes | None:
+        """Retrieve cached document via id."""
+        with self.__lock__:
+            if cached := self.__docs__.get(id):
+                expiration, doc = cached
+                if expiration > monotonic():
+                    self.__docs__.move_to_end(id)
+                    return doc
+                self.__docs__.pop(id, None)
+        return None
+
+    def set(self, id: ObjectId, doc: bytes, epoch: int) -> None:
+        """Cache document if no invalidation happened since `epoch`."""
+        with self.__lock__:
+            if epoch != self.__epoch__ or self.size <= 0:
+                return
+
+            self.__docs__[id] = (monotonic() + self.ttl, doc)
+            self.__docs__.move_to_end(id)
+            while len(self.__docs__) > self.size:
+                self.__docs__.popitem(last=False)
+
+    def forget(self, ids: Iterable[ObjectId]) -> None:
+        """Remove documents from this worker's cache."""
+        with self.__lock__:
+            self.__epoch__ += 1
+            for id in ids:
+                self.__docs__.pop(id, None)
+                if id in self.__pinned__:
+                    self.__pinned__[id] = None
+
+    def invalidate(self, ids: Iterable[ObjectId]) -> None:
+        """Remove documents from cache of every worker."""
+        if ids := list(ids):
+            self.forget(ids)
+            if self.redis:
+                AnchorRedis.invalidate([str(id) for id in ids])
+
+    def clear(self) -> None:
+        """Remove all documents from this worker's cache."""
+        with self.__lock__:
+            self.__epoch__ += 1
+            self.__docs__.clear()
+            self.__pinned__ = dict.fromkeys(self.__pinned__)
+
+    def pin(self, ids: Iterable[ObjectId]) -> None:
+        """Cache documents of ids regardless of size, loaded on next find."""
+        if not self.redis:
+            return
+
+        with self.__lock__:
+            for id in ids:
+                self.__pinned__.setdefault(id, None)
+        self.listen()
+
+    def find_pinned(
+        self,
+        cl: type[Collection[T]],
+        ids: Iterable[ObjectId],
+        codec_options: CodecOptions,
+        session: ClientSession | None = None,
+    ) -> Generator[T, None, list[ObjectId]]:
+        """Find pinned documents, reload invalidated ones and return unpinned ids."""
+        epoch = self.epoch
+        unpinned = []
+        for id in ids:
+            if id not in self.__pinned__:
+                unpinned.append(id)
+            elif (cached := self.__pinned__.get(id)) and cached[0] > monotonic():
+                yield cl.__document__(decode(cached[1], codec_options))
+            elif doc := cl.collection().find_one(
+                {"_id": id}, cl.__excluded_obj__, session=session
+            ):
+                # expire with ttl if subscribing to invalidations failed
+                expiration = monotonic() + self.ttl if not self.__listener__ else inf
+                with self.__lock__:
+                    if epoch == self.__epoch__:
+                        self.__pinned__[id] = (expiration, encode(doc))
+                yield cl.__document__(doc)
+        return unpinned
+
+    def find(
+        self,
+        cl: type[Collection[T]],
+        ids: Iterable[ObjectId],
+        session: ClientSession | None = None,
+    ) -> Generator[T, None, None]:
+        """Find documents from cache and fallback to datasource on misses."""
+        codec_options: CodecOptions = cl.__codec_options__ or DEFAULT_CODEC_OPTIONS
+        if self.__pinned__:
+            ids = yield from self.find_pinned(cl, ids, codec_options, session)
+
+        if not self.enabled:
+            if ids := list(ids):
+                yield from cl.find({"_id": {"$in": ids}}, session=session)
+            return
+
+        self.listen()
+        epoch = self.epoch
+
+        missing = []
+        for id in ids:
+            if raw := self.get(id):
+                yield cl.__document__(decode(raw, codec_options))
+            else:
+                missing.append(id)
+
+        if missing and self.redis:
+            _missing = []
+            for id, raw in zip(
+                missing, AnchorRedis.get_docs([str(id) for id in missing])
+            ):
+                if raw:
+                    self.set(id, raw, epoch)
+                    yield cl.__document__(decode(raw, codec_options))
+                else:
+                    _missing.append(id)
+            missing = _missing
+
+        if missing:
+            for doc in cl.collection().find(
+                {"_id": {"$in": missing}}, cl.__excluded_obj__, session=session
+            ):
+                raw = encode(doc)
+                self.set(doc["_id"], raw, epoch)
+                # other workers' invalidations are rejected via tombstones
+                if self.redis and epoch == self.epoch:
+                    AnchorRedis.set_doc(str(doc["_id"]), raw, self.ttl)
+                yield cl.__document__(doc)
+
+    def find_by_id(
+        self,
+        cl: type[Collection[T]],
+        id: ObjectId,
+        session: ClientSession | None = None,
+    ) -> T | None:
+        """Find document via id from cache and fallback to datasource on miss."""
+        if not self.enabled:
+            return cl.find_by_id(id, session=session)
+        for doc in self.find(cl, [id], session):
+            return doc
+        return None
+
+
+ANCHOR_CACHE = AnchorCache()
@@ -1,7 +1,7 @@
 """Core constructs for Jac Language."""
 
 from contextvars import ContextVar
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
 from os import getenv
 from typing import Any, cast
 
@@ -19,7 +19,9 @@ from .architype import (
     NodeAnchor,
     Permission,
     Root,
+    serialize,
 )
+from .cache import ANCHOR_CACHE
 from .memory import MongoDB
 
 
@@ -51,6 +53,28 @@ class JaseciContext(ExecutionContext):
         """Clean up context."""
         self.mem.close()
 
+    @staticmethod
+    def bootstrap() -> None:
+        """Create system and public root if not yet existing and pin them to cache."""
+        for id, access in (
+            (SUPER_ROOT_ID, Permission()),
+            (PUBLIC_ROOT_ID, Permission(all=AccessLevel.WRITE)),
+        ):
+            root = NodeAnchor(
+                architype=object.__new__(Root),
+                id=id,
+                access=access,
+                state=AnchorState(connected=True),
+                persistent=True,
+                edges=[],
+            )
+            root.architype.__jac__ = root
+            # idempotent even if multiple workers start at the same time
+            NodeAnchor.Collection.update_one(
+                {"_id": id}, {"$setOnInsert": root.serialize()}, upsert=True
+            )
+        ANCHOR_CACHE.pin([SUPER_ROOT_ID, PUBLIC_ROOT_ID])
+
     @staticmethod
     def create(request: Request, entry: NodeAnchor | None = None) -> "JaseciContext":  # type: ignore[override]
         """Create JacContext."""
@@ -61,18 +85,9 @@ class JaseciContext(ExecutionContext):
         ctx.reports = []
 
         if not isinstance(system_root := ctx.mem.find_by_id(SUPER_ROOT), NodeAnchor):
-            system_root = NodeAnchor(
-                architype=object.__new__(Root),
-                id=SUPER_ROOT_ID,
-                access=Permission(),
-                state=AnchorState(connected=True),
-                persistent=True,
-                edges=[],
-            )
-            system_root.architype.__jac__ = system_root
-            NodeAnchor.Collection.insert_one(system_root.serialize())
-            system_root.sync_hash()
-            ctx.mem.set(system_root.id, system_root)
+            # not started via FastAPI lifespan
+            JaseciContext.bootstrap()
+            system_root = cast(NodeAnchor, ctx.mem.find_by_id(SUPER_ROOT))
 
         ctx.system_root = system_root
 
@@ -83,16 +98,8 @@ class JaseciContext(ExecutionContext):
             if not isinstance(
                 public_root := ctx.mem.find_by_id(PUBLIC_ROOT), NodeAnchor
             ):
-                public_root = NodeAnchor(
-                    architype=object.__new__(Root),
-                    id=PUBLIC_ROOT_ID,
-                    access=Permission(all=AccessLevel.WRITE),
-                    state=AnchorState(),
-                    persistent=True,
-                    edges=[],
-                )
-                public_root.architype.__jac__ = public_root
-                ctx.mem.set(public_root.id, public_root)
+                JaseciContext.bootstrap()
+                public_root = cast(NodeAnchor, ctx.mem.find_by_id(PUBLIC_ROOT))
 
             ctx.root = public_root
 
@@ -154,6 +161,6 @@ class JaseciContext(ExecutionContext):
             case BaseArchitype():
                 cast(dict, obj)[key] = val.__jac__.report()
             case val if is_dataclass(val) and not isinstance(val, type):
-                cast(dict, obj)[key] = asdict(val)
+                cast(dict, obj)[key] = serialize(val)
             case _:
                 pass
@@ -1,11 +1,12 @@
 """Memory abstraction for jaseci plugin."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from os import getenv
-from typing import Callable, Generator, Iterable, TypeVar, cast
+from typing import Any, Callable, Generator, Iterable, Mapping, TypeVar, cast
 
 from bson import ObjectId
 
+from jaclang.compiler.constant import EdgeDir
 from jaclang.runtimelib.memory import Memory
 
 
@@ -13,20 +14,26 @@ from pymongo import InsertOne
 from pymongo.client_session import ClientSession
 
 from .architype import (
+    AccessLevel,
     Anchor,
     BaseAnchor,
     BulkWrite,
     EdgeAnchor,
+    EdgeArchitype,
     NodeAnchor,
+    NodeArchitype,
     Root,
     WalkerAnchor,
 )
+from .cache import ANCHOR_CACHE
 from ..jaseci.datasources import Collection
 
 DISABLE_AUTO_CLEANUP = getenv("DISABLE_AUTO_CLEANUP") == "true"
 SINGLE_QUERY = getenv("SINGLE_QUERY") == "true"
 IDS = ObjectId | Iterable[ObjectId]
 BA = TypeVar("BA", bound="BaseAnchor")
+TA = TypeVar("TA", bound="NodeArchitype | EdgeArchitype")
+NO_GRANT = (AccessLevel.NO_ACCESS, AccessLevel.NO_ACCESS)
 
 
 @dataclass
@@ -34,17 +41,254 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
     """Shelf Handler."""
 
     __session__: ClientSession | None = None
+    # identity map of unpopulated references
+    __refs__: dict[ObjectId, BaseAnchor] = field(default_factory=dict)
+    # architype name to fields to load, others are loaded on access
+    __projection__: dict[str, list[str]] = field(default_factory=dict)
+    # (current root id, target root id) to target root's access for all and current root
+    __grants__: dict[tuple[ObjectId, ObjectId], tuple[AccessLevel, AccessLevel]] = (
+        field(default_factory=dict)
+    )
+
+    def intern(self, anchor: BA) -> BA:
+        """Resolve anchor to the single instance of its id in this memory."""
+        if isinstance(mem := self.__mem__.get(anchor.id), anchor.__class__):
+            return cast(BA, mem)
+        return cast(BA, self.__refs__.setdefault(anchor.id, anchor))
+
+    def adopt(self, anchor: BA) -> BA:
+        """Add loaded anchor to memory and merge it to its interned reference."""
+        if (mem := self.__mem__.get(anchor.id)) is not None:
+            return cast(BA, mem)
+
+        if (ref := self.__refs__.pop(anchor.id, None)) and ref is not anchor:
+            ref.__dict__.update(anchor.__dict__)
+            ref.architype.__jac__ = ref  # type: ignore[assignment]
+            anchor = cast(BA, ref)
+
+        self.__mem__[anchor.id] = anchor
+        return anchor
 
     def populate_data(self, edges: Iterable[EdgeAnchor]) -> None:
-        """Populate data to avoid multiple query."""
+        """Populate edges then their nodes with single query per collection each."""
         if not SINGLE_QUERY:
-            nodes: set[NodeAnchor] = set()
-            for edge in self.find(edges):
-                if edge.source:
-                    nodes.add(edge.source)
-                if edge.target:
-                    nodes.add(edge.target)
-            self.find(nodes)
+            edges = list(edges)
+            self.populate_anchors(edges)
+            self.populate_anchors(
+                node
+                for edge in edges
+                if edge.is_populated()
+                for node in (edge.source, edge.target)
+            )
+
+    def prefetch(
+        self,
+        anchor: NodeAnchor,
+        depth: int,
+        dir: EdgeDir = EdgeDir.OUT,
+        session: ClientSession | None = None,
+    ) -> None:
+        """
+        Load k-hop neighborhood of node in single aggregation via $graphLookup.
+
+        Edges (and their other end node) reachable within `depth` hops are
+        stored to memory so following edge refs won't query per hop.
+        EdgeDir.ANY runs both outgoing and incoming aggregation.
+        """
+        if depth < 1:
+            return
+
+        session = session or self.__session__
+        connections = []
+        if dir in (EdgeDir.OUT, EdgeDir.ANY):
+            connections.append(("target", "source"))
+        if dir in (EdgeDir.IN, EdgeDir.ANY):
+            connections.append(("source", "target"))
+
+        for _from, _to in connections:
+            for doc in NodeAnchor.Collection.aggregate(
+                [
+                    {"$match": {"_id": anchor.id}},
+                    {
+                        "$graphLookup": {
+                            "from": EdgeAnchor.Collection.collection().name,
+                            "startWith": anchor.ref_id,
+                            "connectFromField": _from,
+                            "connectToField": _to,
+                            "maxDepth": depth - 1,
+                            "as": "__edges__",
+                        }
+                    },
+                    {"$unwind": "$__edges__"},
+                    {"$replaceRoot": {"newRoot": "$__edges__"}},
+                    {
+                        "$lookup": {
+                            "from": NodeAnchor.Collection.collection().name,
+                            "let": {"ref": f"${_from}"},
+                            "pipeline": [
+                                {
+                                    "$match": {
+                                        "$expr": {
+                                            "$eq": [
+                                                "$_id",
+                                                {
+                                                    "$toObjectId": {
+                                                        "$arrayElemAt": [
+                                                            {"$split": ["$$ref", ":"]},
+                                                            2,
+                                                        ]
+                                                    }
+                                                },
+                                            ]
+                                        }
+                                    }
+                                }
+                            ],
+                            "as": "__node__",
+                        }
+                    },
+                ],
+                session=session,
+            ):
+                doc = dict(doc)  # RawBSONDocument on LAZY_HYDRATION
+                nodes = doc.pop("__node__")
+                if (
+                    doc["_id"] not in self.__mem__
+                    and (edge := EdgeAnchor.Collection.__document__(doc))
+                    not in self.__gc__
+                ):
+                    self.adopt(edge)
+                for node in nodes:
+                    if (
+                        node["_id"] not in self.__mem__
+                        and (_node := NodeAnchor.Collection.__document__(node))
+                        not in self.__gc__
+                    ):
+                        self.adopt(_node)
+
+    def find_edges(
+        self,
+        node: NodeAnchor,
+        dir: EdgeDir = EdgeDir.IN,
+        name: str | None = None,
+        session: ClientSession | None = None,
+    ) -> Generator[EdgeAnchor, None, None]:
+        """
+        Find edges of node from edge collection instead of node's edges.
+
+        Uses source/target indexes so incoming edges of hub nodes, dangling
+        refs and cascade deletions can be resolved without loading `edges`.
+        """
+        for edge in EdgeAnchor.Collection.find(
+            node.edges_query(dir, name), session=session or self.__session__
+        ):
+            if edge not in self.__gc__:
+                yield self.adopt(edge)
+
+    def find_architypes(
+        self,
+        arch_cls: type[TA],
+        filter: Mapping[str, Any] | None = None,
+        root: ObjectId | None = None,
+        session: ClientSession | None = None,
+    ) -> Generator[TA, None, None]:
+        """
+        Find node/edge architypes via their fields, scoped to current root.
+
+        Meant for fields declared in `__specs__.indexes`. Only saved anchors are
+        matched as the query runs against the datasource. Architypes of other
+        root are only returned if current root has read access.
+        """
+        from .context import JaseciContext
+
+        jroot = JaseciContext.get().root
+        if root is None:
+            root = jroot.id
+
+        query: dict[str, Any] = {"name": arch_cls.__name__, "root": root}
+        for key, val in (filter or {}).items():
+            query[f"architype.{key}"] = val
+
+        collection: type[NodeAnchor.Collection | EdgeAnchor.Collection] = (
+            NodeAnchor.Collection
+            if issubclass(arch_cls, NodeArchitype)
+            else EdgeAnchor.Collection
+        )
+        for anchor in collection.find(query, session=session or self.__session__):
+            if anchor not in self.__gc__ and (
+                root == jroot.id or jroot.has_read_access(anchor)
+            ):
+                yield cast(TA, self.adopt(anchor).architype)
+
+    def find_projected(
+        self,
+        cl: type[Collection[BA]],
+        name: str,
+        ids: list[ObjectId],
+        session: ClientSession | None = None,
+    ) -> Generator[BA, None, None]:
+        """Find anchors of architype `name` with only fields from projection."""
+        projection = dict.fromkeys(getattr(cl, "__anchor_fields__", []), True)
+        for key in self.__projection__[name]:
+            projection[f"architype.{key}"] = True
+
+        for doc in cl.collection().find(
+            {"_id": {"$in": ids}}, projection, session=session or self.__session__
+        ):
+            doc = dict(doc)
+            doc["__partial__"] = True
+            yield cl.__document__(doc)
+
+    def root_access(
+        self, root: NodeAnchor, target_root: ObjectId
+    ) -> tuple[AccessLevel, AccessLevel]:
+        """Get access of target root's graph for all and for root, once per request."""
+        if (grant := self.__grants__.get((root.id, target_root))) is None:
+            grant = NO_GRANT
+            if isinstance(
+                to_root := self.find_by_id(NodeAnchor.ref(f"n::{target_root}")), Anchor
+            ):
+                access = to_root.peek_access()
+                grant = (access.all, access.roots.check(root.ref_id))
+            self.__grants__[(root.id, target_root)] = grant
+        return grant
+
+    def check_roots(
+        self, root: NodeAnchor, anchors: Iterable[BaseAnchor | Anchor]
+    ) -> None:
+        """Load uncached root access of anchors' graphs with single query."""
+        from .context import SUPER_ROOT_ID
+
+        if SINGLE_QUERY or root.id == SUPER_ROOT_ID:
+            return
+
+        targets = {
+            anchor.root
+            for anchor in anchors
+            if isinstance(anchor, BaseAnchor)
+            and anchor.is_populated()
+            and anchor.root
+            and anchor.root != root.id
+            and (root.id, anchor.root) not in self.__grants__
+        }
+        if targets:
+            list(self.find([NodeAnchor.ref(f"n::{target}") for target in targets]))
+            for target in targets:
+                self.root_access(root, target)
+
+    def populate_anchors(self, anchors: Iterable[BaseAnchor | Anchor]) -> None:
+        """Populate unpopulated anchors with single query per collection."""
+        if not SINGLE_QUERY and (
+            unpopulated := [
+                anchor
+                for anchor in anchors
+                if isinstance(anchor, BaseAnchor) and not anchor.is_populated()
+            ]
+        ):
+            populated = {anchor.id: anchor for anchor in self.find(unpopulated)}
+            for anchor in unpopulated:
+                if data := populated.get(anchor.id):
+                    anchor.__dict__.update(data.__dict__)
 
     def find(  # type: ignore[override]
         self,
@@ -57,22 +301,27 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
             anchors = [anchors]
 
         collections: dict[type[Collection[BaseAnchor]], list[ObjectId]] = {}
+        projected: dict[tuple[type[Collection[BaseAnchor]], str], list[ObjectId]] = {}
         for anchor in anchors:
             if anchor.id not in self.__mem__ and anchor not in self.__gc__:
-                coll = collections.get(anchor.Collection)
-                if coll is None:
-                    coll = collections[anchor.Collection] = []
+                if anchor.name in self.__projection__:
+                    coll = projected.get((anchor.Collection, anchor.name))
+                    if coll is None:
+                        coll = projected[(anchor.Collection, anchor.name)] = []
+                else:
+                    coll = collections.get(anchor.Collection)
+                    if coll is None:
+                        coll = collections[anchor.Collection] = []
 
                 coll.append(anchor.id)
 
         for cl, ids in collections.items():
-            for anch_db in cl.find(
-                {
-                    "_id": {"$in": ids},
-                },
-                session=session or self.__session__,
-            ):
-                self.__mem__[anch_db.id] = anch_db
+            for anch_db in ANCHOR_CACHE.find(cl, ids, session or self.__session__):
+                self.adopt(anch_db)
+
+        for (cl, name), ids in projected.items():
+            for anch_db in self.find_projected(cl, name, ids, session):
+                self.adopt(anch_db)
 
         for anchor in anchors:
             if (
@@ -95,8 +344,19 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
         """Find one by id."""
         data = super().find_by_id(anchor.id)
 
-        if not data and (data := anchor.Collection.find_by_id(anchor.id)):
-            self.__mem__[data.id] = data
+        if not data and (
+            data := (
+                next(
+                    self.find_projected(anchor.Collection, anchor.name, [anchor.id]),
+                    None,
+                )
+                if anchor.name in self.__projection__
+                else ANCHOR_CACHE.find_by_id(
+                    anchor.Collection, anchor.id, self.__session__
+                )
+            )
+        ):
+            data = self.adopt(data)
 
         return data
 
@@ -112,6 +372,8 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
                     bulk_write.execute(session)
 
         super().close()
+        self.__refs__.clear()
+        self.__grants__.clear()
 
     def get_bulk_write(self) -> BulkWrite:
         """Sync memory to database."""
@@ -124,6 +386,8 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
             match anchor:
                 case NodeAnchor():
                     bulk_write.del_node(anchor.id)
+                    if anchor.__dict__.get("bucketed"):
+                        bulk_write.del_buckets(anchor.id)
                 case EdgeAnchor():
                     bulk_write.del_edge(anchor.id)
                 case WalkerAnchor():
@@ -136,20 +400,23 @@ class MongoDB(Memory[ObjectId, BaseAnchor | Anchor]):
                 if not anchor.state.connected:
                     anchor.state.connected = True
                     anchor.sync_hash()
+                    if isinstance(anchor, NodeAnchor) and anchor.outgrown:
+                        anchor.bucketed = True
                     bulk_write.operations[anchor.__class__].append(
                         InsertOne(anchor.serialize())
                     )
-                elif (new_hash := anchor.has_changed()) and anchor.has_connect_access(
-                    anchor
-                ):
-                    anchor.state.full_hash = new_hash
+                    if isinstance(anchor, NodeAnchor) and anchor.bucketed:
+                        bulk_write.add_edges(anchor.id, anchor.edges)
+                elif anchor.has_changed() and anchor.has_connect_access(anchor):
                     if (
                         not DISABLE_AUTO_CLEANUP
                         and isinstance(anchor, NodeAnchor)
                         and not isinstance(anchor.architype, Root)
-                        and not anchor.edges
+                        and not anchor.has_edges()
                     ):
                         bulk_write.del_node(anchor.id)
+                        if anchor.bucketed:
+                            bulk_write.del_buckets(anchor.id)
                     else:
                         anchor.update(bulk_write)
 
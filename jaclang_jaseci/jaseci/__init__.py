@@ -51,8 +51,10 @@ class FastAPI:
             @asynccontextmanager
             async def lifespan(app: _FaststAPI) -> AsyncGenerator[None, _FaststAPI]:
                 from .datasources import Collection
+                from ..core.context import JaseciContext
 
                 Collection.apply_indexes()
+                JaseciContext.bootstrap()
                 yield
 
             cls.__app__ = _FaststAPI(lifespan=lifespan)
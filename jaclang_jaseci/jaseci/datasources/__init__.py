@@ -1,12 +1,14 @@
 """Jaseci Datasources."""
 
 from .collection import Collection
-from .redis import CodeRedis, Redis, TokenRedis
+from .redis import AnchorRedis, CodeRedis, PrincipalRedis, Redis, TokenRedis
 
 
 __all__ = [
+    "AnchorRedis",
     "Collection",
     "CodeRedis",
+    "PrincipalRedis",
     "Redis",
     "TokenRedis",
 ]
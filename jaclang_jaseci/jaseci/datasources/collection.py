@@ -13,6 +13,7 @@ from typing import (
 )
 
 from bson import ObjectId
+from bson.codec_options import CodecOptions
 
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
@@ -64,6 +65,8 @@ class Collection(Generic[T]):
     __collection__: str | None = None
     # Singleton Collection Instance
     __collection_obj__: PyMongoCollection | None = None
+    # Custom decoding such as RawBSONDocument
+    __codec_options__: CodecOptions | None = None
 
     # Custom Index Declaration
     __indexes__: list[dict] = []
@@ -111,9 +114,21 @@ class Collection(Generic[T]):
                 for idx in cls.__indexes__:
                     idxs.append(IndexModel(**idx))
 
+            for idx in cls.__dynamic_indexes__():
+                idxs.append(IndexModel(**idx))
+
             if idxs:
                 cls.collection().create_indexes(idxs)
 
+    @classmethod
+    def __dynamic_indexes__(cls) -> list[dict]:
+        """
+        Return additional index declarations resolved during apply_indexes.
+
+        You may override this for indexes that depends on runtime declarations.
+        """
+        return []
+
     @classmethod
     def __document__(cls, doc: Mapping[str, Any]) -> T:
         """
@@ -164,16 +179,21 @@ class Collection(Generic[T]):
         return Collection.__database__
 
     @staticmethod
-    def get_collection(collection: str) -> PyMongoCollection:
+    def get_collection(
+        collection: str, codec_options: CodecOptions | None = None
+    ) -> PyMongoCollection:
         """Return pymongo.collection.Collection for collection connection based from current database connection."""
-        return Collection.get_database().get_collection(collection)
+        return Collection.get_database().get_collection(
+            collection, codec_options=codec_options
+        )
 
     @classmethod
     def collection(cls) -> PyMongoCollection:
         """Return pymongo.collection.Collection for collection connection based from attribute of it's child class."""
         if not isinstance(cls.__collection_obj__, PyMongoCollection):
             cls.__collection_obj__ = cls.get_collection(
-                getattr(cls, "__collection__", None) or cls.__name__.lower()
+                getattr(cls, "__collection__", None) or cls.__name__.lower(),
+                cls.__codec_options__,
             )
 
         return cls.__collection_obj__
@@ -403,9 +423,21 @@ class AsyncCollection(Generic[T]):
                 for idx in cls.__indexes__:
                     idxs.append(IndexModel(**idx))
 
+            for idx in cls.__dynamic_indexes__():
+                idxs.append(IndexModel(**idx))
+
             if idxs:
                 await cls.collection().create_indexes(idxs)
 
+    @classmethod
+    def __dynamic_indexes__(cls) -> list[dict]:
+        """
+        Return additional index declarations resolved during apply_indexes.
+
+        You may override this for indexes that depends on runtime declarations.
+        """
+        return []
+
     @classmethod
     def __document__(cls, doc: Mapping[str, Any]) -> T:
         """
@@ -1,16 +1,19 @@
 """Jaseci Redis."""
 
 from os import getenv
-from typing import Any
+from typing import Any, Callable
 
 from fakeredis import FakeRedis
 
 from orjson import dumps, loads
 
 from redis.asyncio.client import Redis as _AsyncRedis
-from redis.client import Redis as _Redis
+from redis.client import PubSubWorkerThread, Redis as _Redis
 
-from ..utils import logger
+from ..utils import fingerprint, logger, utc_timestamp
+
+# also check entries stored in hashes before per key layouts
+REDIS_LEGACY_KEYS = getenv("REDIS_LEGACY_KEYS") == "true"
 
 
 class Redis:
@@ -26,6 +29,8 @@ class Redis:
 
     # Redis Hash Name
     __table__ = "common"
+    # Redis Publish/Subscribe Channel
+    __channel__ = "common:invalidate"
 
     ##########################################
     # ---------- Parent Properties --------- #
@@ -147,25 +152,219 @@ class Redis:
             logger.exception(f"Error deleting key {key} from {cls.__table__}")
             return False
 
+    @classmethod
+    def publish(cls, data: list[str]) -> bool:
+        """Notify every worker subscribed to channel."""
+        try:
+            redis = cls.get_rd()
+            redis.publish(cls.__channel__, dumps(data))
+            return True
+        except Exception:
+            logger.exception(f"Error publishing {data} to {cls.__channel__}")
+            return False
+
+    @classmethod
+    def subscribe(
+        cls, handler: Callable[[list[str]], None]
+    ) -> PubSubWorkerThread | None:
+        """Listen to invalidations from other workers."""
+        try:
+            pubsub = cls.get_rd().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(
+                **{cls.__channel__: lambda message: handler(loads(message["data"]))}
+            )
+            return pubsub.run_in_thread(sleep_time=0.01, daemon=True)
+        except Exception:
+            logger.exception(f"Error subscribing to {cls.__channel__}")
+            return None
+
 
 class CodeRedis(Redis):
     """Code Memory Interface.
 
     This interface is for Code Management such as Verification Code.
+    Codes are stored per key with expiration and consumed only once.
     You may override this if you wish to implement different structure
     """
 
     __table__ = "verification"
+    # also consume codes created before per code keys
+    __legacy__ = REDIS_LEGACY_KEYS
+
+    @classmethod
+    def key(cls, code: str) -> str:
+        """Return redis key of code."""
+        return f"{cls.__table__}:{fingerprint(code)}"
+
+    @classmethod
+    def add_code(cls, code: str, ttl: int) -> bool:
+        """Push code that expires in seconds."""
+        try:
+            redis = cls.get_rd()
+            return bool(redis.set(cls.key(code), dumps(True), ex=ttl))
+        except Exception:
+            logger.exception(f"Error adding code to {cls.__table__}")
+            return False
+
+    @classmethod
+    def consume_code(cls, code: str) -> bool:
+        """Atomically retrieve and delete code, return if it's still valid."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                return bool(redis.getdel(cls.key(code)))
+
+            with redis.pipeline() as pipe:
+                pipe.getdel(cls.key(code))
+                pipe.hdel(cls.__table__, code)
+                valid, legacy = pipe.execute()
+            return bool(valid or legacy)
+        except Exception:
+            logger.exception(f"Error consuming code from {cls.__table__}")
+            return False
 
 
 class TokenRedis(Redis):
     """Token Memory Interface.
 
     This interface is for Token Management.
+    Tokens are stored as fingerprints per user in a sorted set scored by
+    expiration so revoking every token of a user is a single delete.
     You may override this if you wish to implement different structure
     """
 
     __table__ = "token"
+    # also check tokens created before per user keys
+    __legacy__ = REDIS_LEGACY_KEYS
+
+    @classmethod
+    def key(cls, user_id: str) -> str:
+        """Return redis key of user's tokens."""
+        return f"{cls.__table__}:{user_id}"
+
+    @classmethod
+    def add_token(cls, user_id: str, token: str, expiration: int) -> bool:
+        """Push token of user that expires on timestamp."""
+        try:
+            redis = cls.get_rd()
+            key = cls.key(user_id)
+            with redis.pipeline() as pipe:
+                pipe.zremrangebyscore(key, "-inf", utc_timestamp())
+                pipe.zadd(key, {fingerprint(token): expiration})
+                # tokens share same timeout, latest token expires last
+                pipe.expireat(key, expiration)
+                return bool(pipe.execute()[1])
+        except Exception:
+            logger.exception(f"Error adding token of {user_id} to {cls.__table__}")
+            return False
+
+    @classmethod
+    def has_token(cls, user_id: str, token: str) -> bool:
+        """Check if token of user is still valid."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                expiration = redis.zscore(cls.key(user_id), fingerprint(token))
+                return expiration is not None and expiration > utc_timestamp()
+
+            with redis.pipeline(transaction=False) as pipe:
+                pipe.zscore(cls.key(user_id), fingerprint(token))
+                pipe.hexists(cls.__table__, f"{user_id}:{token}")
+                expiration, legacy = pipe.execute()
+            return bool(
+                (expiration is not None and expiration > utc_timestamp()) or legacy
+            )
+        except Exception:
+            logger.exception(f"Error getting token of {user_id} from {cls.__table__}")
+            return False
+
+    @classmethod
+    def revoke_tokens(cls, user_id: str) -> bool:
+        """Delete every token of user."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                redis.delete(cls.key(user_id))
+                return True
+
+            with redis.pipeline() as pipe:
+                pipe.delete(cls.key(user_id))
+                pipe.exists(cls.__table__)
+                _, legacy = pipe.execute()
+            if legacy:
+                return cls.hdelete_rgx(f"{user_id}:*")
+            return True
+        except Exception:
+            logger.exception(f"Error deleting tokens of {user_id} from {cls.__table__}")
+            return False
+
+
+class PrincipalRedis(Redis):
+    """Principal Memory Interface.
+
+    This interface is for broadcasting users whose tokens are invalidated
+    to every worker's authenticated principal cache.
+    You may override this if you wish to implement different structure
+    """
+
+    __table__ = "principal"
+    __channel__ = "principal:invalidate"
+
+
+class AnchorRedis(Redis):
+    """Anchor Memory Interface.
+
+    This interface is for sharing serialized anchor documents across workers.
+    Documents are stored as raw BSON per key and invalidations are broadcasted
+    via publish/subscribe. Invalidated keys are replaced by short-lived tombstones
+    so documents read before the invalidation can't be pushed back.
+    You may override this if you wish to implement different structure
+    """
+
+    __table__ = "anchor"
+    __channel__ = "anchor:invalidate"
+    # seconds an invalidated key rejects documents read before the invalidation
+    __tombstone__ = 5.0
+
+    @classmethod
+    def key(cls, id: str) -> str:
+        """Return redis key of anchor document."""
+        return f"{cls.__table__}:{id}"
+
+    @classmethod
+    def get_docs(cls, ids: list[str]) -> list[bytes | None]:
+        """Retrieve multiple anchor documents."""
+        try:
+            redis = cls.get_rd()
+            return [doc or None for doc in redis.mget([cls.key(id) for id in ids])]
+        except Exception:
+            logger.exception(f"Error getting documents {ids} from {cls.__table__}")
+            return [None] * len(ids)
+
+    @classmethod
+    def set_doc(cls, id: str, doc: bytes, ttl: float) -> bool:
+        """Push anchor document with expiration in seconds if key is not yet set."""
+        try:
+            redis = cls.get_rd()
+            return bool(redis.set(cls.key(id), doc, px=int(ttl * 1000), nx=True))
+        except Exception:
+            logger.exception(f"Error setting document {id} from {cls.__table__}")
+            return False
+
+    @classmethod
+    def invalidate(cls, ids: list[str]) -> bool:
+        """Delete anchor documents and notify other workers."""
+        try:
+            redis = cls.get_rd()
+            with redis.pipeline() as pipe:
+                for id in ids:
+                    pipe.set(cls.key(id), b"", px=int(cls.__tombstone__ * 1000))
+                pipe.publish(cls.__channel__, dumps(ids))
+                pipe.execute()
+            return True
+        except Exception:
+            logger.exception(f"Error invalidating documents {ids} from {cls.__table__}")
+            return False
 
 
 class AsyncRedis:
@@ -303,17 +502,117 @@ class AsyncCodeRedis(AsyncRedis):
     """Code Memory Interface.
 
     This interface is for Code Management such as Verification Code.
+    Codes are stored per key with expiration and consumed only once.
     You may override this if you wish to implement different structure
     """
 
     __table__ = "verification"
+    # also consume codes created before per code keys
+    __legacy__ = REDIS_LEGACY_KEYS
+
+    @classmethod
+    def key(cls, code: str) -> str:
+        """Return redis key of code."""
+        return f"{cls.__table__}:{fingerprint(code)}"
+
+    @classmethod
+    async def add_code(cls, code: str, ttl: int) -> bool:
+        """Push code that expires in seconds."""
+        try:
+            redis = cls.get_rd()
+            return bool(await redis.set(cls.key(code), dumps(True), ex=ttl))
+        except Exception:
+            logger.exception(f"Error adding code to {cls.__table__}")
+            return False
+
+    @classmethod
+    async def consume_code(cls, code: str) -> bool:
+        """Atomically retrieve and delete code, return if it's still valid."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                return bool(await redis.getdel(cls.key(code)))
+
+            async with redis.pipeline() as pipe:
+                pipe.getdel(cls.key(code))
+                pipe.hdel(cls.__table__, code)
+                valid, legacy = await pipe.execute()
+            return bool(valid or legacy)
+        except Exception:
+            logger.exception(f"Error consuming code from {cls.__table__}")
+            return False
 
 
 class AsyncTokenRedis(AsyncRedis):
     """Token Memory Interface.
 
     This interface is for Token Management.
+    Tokens are stored as fingerprints per user in a sorted set scored by
+    expiration so revoking every token of a user is a single delete.
     You may override this if you wish to implement different structure
     """
 
     __table__ = "token"
+    # also check tokens created before per user keys
+    __legacy__ = REDIS_LEGACY_KEYS
+
+    @classmethod
+    def key(cls, user_id: str) -> str:
+        """Return redis key of user's tokens."""
+        return f"{cls.__table__}:{user_id}"
+
+    @classmethod
+    async def add_token(cls, user_id: str, token: str, expiration: int) -> bool:
+        """Push token of user that expires on timestamp."""
+        try:
+            redis = cls.get_rd()
+            key = cls.key(user_id)
+            async with redis.pipeline() as pipe:
+                pipe.zremrangebyscore(key, "-inf", utc_timestamp())
+                pipe.zadd(key, {fingerprint(token): expiration})
+                # tokens share same timeout, latest token expires last
+                pipe.expireat(key, expiration)
+                return bool((await pipe.execute())[1])
+        except Exception:
+            logger.exception(f"Error adding token of {user_id} to {cls.__table__}")
+            return False
+
+    @classmethod
+    async def has_token(cls, user_id: str, token: str) -> bool:
+        """Check if token of user is still valid."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                expiration = await redis.zscore(cls.key(user_id), fingerprint(token))
+                return expiration is not None and expiration > utc_timestamp()
+
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.zscore(cls.key(user_id), fingerprint(token))
+                pipe.hexists(cls.__table__, f"{user_id}:{token}")
+                expiration, legacy = await pipe.execute()
+            return bool(
+                (expiration is not None and expiration > utc_timestamp()) or legacy
+            )
+        except Exception:
+            logger.exception(f"Error getting token of {user_id} from {cls.__table__}")
+            return False
+
+    @classmethod
+    async def revoke_tokens(cls, user_id: str) -> bool:
+        """Delete every token of user."""
+        try:
+            redis = cls.get_rd()
+            if not cls.__legacy__:
+                await redis.delete(cls.key(user_id))
+                return True
+
+            async with redis.pipeline() as pipe:
+                pipe.delete(cls.key(user_id))
+                pipe.exists(cls.__table__)
+                _, legacy = await pipe.execute()
+            if legacy:
+                return await cls.hdelete_rgx(f"{user_id}:*")
+            return True
+        except Exception:
+            logger.exception(f"Error deleting tokens of {user_id} from {cls.__table__}")
+            return False
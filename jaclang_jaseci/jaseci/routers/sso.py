@@ -29,7 +29,12 @@ from pymongo.errors import ConnectionFailure, OperationFailure
 
 from ..dtos import AttachSSO, DetachSSO
 from ..models import NO_PASSWORD, User as BaseUser
-from ..security import authenticator, create_code, create_token
+from ..security import (
+    PRINCIPAL_CACHE,
+    authenticator,
+    create_code,
+    create_token,
+)
 from ..sso import AppleSSO, GoogleSSO
 from ..utils import logger
 from ...core.architype import BulkWrite, NodeAnchor, Root
@@ -152,6 +157,7 @@ def sso_attach(request: Request, attach_sso: AttachSSO) -> ORJSONResponse:
                 }
             },
         )
+        PRINCIPAL_CACHE.invalidate(request._user.id)  # type: ignore[attr-defined]
 
         return ORJSONResponse({"message": "Successfully Updated SSO!"}, 200)
     return ORJSONResponse({"message": "Feature not yet implemented!"}, 501)
@@ -165,6 +171,7 @@ def sso_detach(request: Request, detach_sso: DetachSSO) -> ORJSONResponse:
             {"_id": ObjectId(request._user.id)},
             {"$unset": {f"sso.{detach_sso.platform}": 1}},
         )
+        PRINCIPAL_CACHE.invalidate(request._user.id)  # type: ignore[attr-defined]
         return ORJSONResponse({"message": "Successfully Updated SSO!"}, 200)
     return ORJSONResponse({"message": "Feature not yet implemented!"}, 501)
 
@@ -19,6 +19,7 @@ from ..dtos import (
 )
 from ..models import User as BaseUser
 from ..security import (
+    PRINCIPAL_CACHE,
     authenticator,
     create_code,
     create_token,
@@ -96,6 +97,7 @@ def verify(req: UserVerification) -> ORJSONResponse:
     if (user_id := verify_code(req.code)) and User.Collection.update_by_id(
         user_id, {"$set": {"is_activated": True}}
     ):
+        PRINCIPAL_CACHE.invalidate(user_id)
         return ORJSONResponse({"message": "Successfully Verified!"}, 200)
 
     return ORJSONResponse({"message": "Verification Failed!"}, 403)
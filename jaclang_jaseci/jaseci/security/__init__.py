@@ -1,6 +1,10 @@
 """Jaseci Securities."""
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from os import getenv
+from threading import Lock
+from time import monotonic
 from typing import Any
 
 from bson import ObjectId
@@ -11,10 +15,13 @@ from fastapi.security import HTTPBearer
 
 from jwt import decode, encode
 
-from ..datasources.redis import CodeRedis, TokenRedis
+from redis.client import PubSubWorkerThread
+
+from ..datasources.redis import CodeRedis, PrincipalRedis, TokenRedis
 from ..models.user import User as BaseUser
-from ..utils import logger, random_string, utc_timestamp
+from ..utils import fingerprint, logger, random_string, utc_timestamp
 from ...core.architype import NodeAnchor
+from ...core.cache import ANCHOR_CACHE
 
 
 TOKEN_SECRET = getenv("TOKEN_SECRET", random_string(50))
@@ -22,9 +29,113 @@ TOKEN_ALGORITHM = getenv("TOKEN_ALGORITHM", "HS256")
 VERIFICATION_CODE_TIMEOUT = int(getenv("VERIFICATION_CODE_TIMEOUT") or "24")
 RESET_CODE_TIMEOUT = int(getenv("RESET_CODE_TIMEOUT") or "24")
 TOKEN_TIMEOUT = int(getenv("TOKEN_TIMEOUT") or "12")
+PRINCIPAL_CACHE_TTL = float(getenv("PRINCIPAL_CACHE_TTL") or "0")
+PRINCIPAL_CACHE_SIZE = int(getenv("PRINCIPAL_CACHE_SIZE") or "10000")
 User = BaseUser.model()
 
 
+@dataclass
+class PrincipalCache:
+    """
+    Process-wide authenticated user cache per token fingerprint.
+
+    Entries expire after `ttl` seconds or on token expiration, whichever comes first.
+    Least recently used entries are evicted once there are more than `size`.
+    Invalidated users are broadcasted via PrincipalRedis to every worker.
+    Users loaded before an invalidation are not cached, see `epoch`.
+    """
+
+    ttl: float = PRINCIPAL_CACHE_TTL
+    size: int = PRINCIPAL_CACHE_SIZE
+
+    __principals__: OrderedDict[str, tuple[float, int, BaseUser]] = field(
+        default_factory=OrderedDict
+    )
+    __users__: dict[str, set[str]] = field(default_factory=dict)
+    __epoch__: int = 0
+    __lock__: Lock = field(default_factory=Lock)
+    __listener__: PubSubWorkerThread | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Check if cache is enabled."""
+        return self.ttl > 0
+
+    @property
+    def epoch(self) -> int:
+        """Return current invalidation epoch."""
+        return self.__epoch__
+
+    def listen(self) -> None:
+        """Subscribe to invalidations from other workers if not yet subscribed."""
+        if self.__listener__ is None:
+            with self.__lock__:
+                if self.__listener__ is None:
+                    self.__listener__ = PrincipalRedis.subscribe(self.forget)
+
+    def get(self, key: str) -> BaseUser | None:
+        """Retrieve cached user of token fingerprint."""
+        if self.enabled:
+            self.listen()
+
+        with self.__lock__:
+            if cached := self.__principals__.get(key):
+                expiration, token_expiration, user = cached
+                if expiration > monotonic() and token_expiration > utc_timestamp():
+                    self.__principals__.move_to_end(key)
+                    return user
+                self.remove(key)
+        return None
+
+    def set(self, key: str, token_expiration: int, user: BaseUser, epoch: int) -> None:
+        """Cache user of token fingerprint if no invalidation happened since `epoch`."""
+        with self.__lock__:
+            if epoch != self.__epoch__:
+                return
+
+            self.__principals__[key] = (
+                monotonic() + self.ttl,
+                token_expiration,
+                user,
+            )
+            self.__principals__.move_to_end(key)
+            self.__users__.setdefault(str(user.id), set()).add(key)
+
+            now = monotonic()
+            while self.__principals__:
+                # sweep expired and overflowing least recently used entries
+                oldest, (expiration, _, _) = next(iter(self.__principals__.items()))
+                if expiration > now and len(self.__principals__) <= self.size:
+                    break
+                self.remove(oldest)
+
+    def remove(self, key: str) -> None:
+        """Remove entry and its user's reference, lock must be held."""
+        if cached := self.__principals__.pop(key, None):
+            user_id = str(cached[2].id)
+            if (keys := self.__users__.get(user_id)) is not None:
+                keys.discard(key)
+                if not keys:
+                    self.__users__.pop(user_id, None)
+
+    def forget(self, user_ids: list[str]) -> None:
+        """Remove cached tokens of users from this worker's cache."""
+        with self.__lock__:
+            self.__epoch__ += 1
+            for user_id in user_ids:
+                for key in self.__users__.pop(user_id, ()):
+                    self.__principals__.pop(key, None)
+
+    def invalidate(self, user_id: ObjectId) -> None:
+        """Remove cached tokens of user from cache of every worker."""
+        if self.enabled:
+            self.forget([str(user_id)])
+            PrincipalRedis.publish([str(user_id)])
+
+
+PRINCIPAL_CACHE = PrincipalCache()
+
+
 def encrypt(data: dict) -> str:
     """Encrypt data."""
     return encode(data, key=TOKEN_SECRET, algorithm=TOKEN_ALGORITHM)
@@ -41,16 +152,15 @@ def decrypt(token: str) -> dict | None:
 
 def create_code(user_id: ObjectId, reset: bool = False) -> str:
     """Generate Verification Code."""
+    timeout = RESET_CODE_TIMEOUT if reset else VERIFICATION_CODE_TIMEOUT
     verification = encrypt(
         {
             "user_id": str(user_id),
             "reset": reset,
-            "expiration": utc_timestamp(
-                hours=RESET_CODE_TIMEOUT if reset else VERIFICATION_CODE_TIMEOUT
-            ),
+            "expiration": utc_timestamp(hours=timeout),
         }
     )
-    if CodeRedis.hset(key=verification, data=True):
+    if CodeRedis.add_code(verification, timeout * 3600):
         return verification
     raise HTTPException(500, "Verification Creation Failed!")
 
@@ -62,9 +172,8 @@ def verify_code(code: str, reset: bool = False) -> ObjectId | None:
         decrypted
         and decrypted["reset"] == reset
         and decrypted["expiration"] > utc_timestamp()
-        and CodeRedis.hget(key=code)
+        and CodeRedis.consume_code(code)
     ):
-        CodeRedis.hdelete(code)
         return ObjectId(decrypted["user_id"])
     return None
 
@@ -74,14 +183,15 @@ def create_token(user: dict[str, Any]) -> str:
     user["expiration"] = utc_timestamp(hours=TOKEN_TIMEOUT)
     user["state"] = random_string(8)
     token = encrypt(user)
-    if TokenRedis.hset(f"{user['id']}:{token}", True):
+    if TokenRedis.add_token(user["id"], token, user["expiration"]):
         return token
     raise HTTPException(500, "Token Creation Failed!")
 
 
 def invalidate_token(user_id: ObjectId) -> None:
     """Invalidate token of current user."""
-    TokenRedis.hdelete_rgx(f"{user_id}:*")
+    TokenRedis.revoke_tokens(str(user_id))
+    PRINCIPAL_CACHE.invalidate(user_id)
 
 
 def authenticate(request: Request) -> None:
@@ -89,13 +199,22 @@ def authenticate(request: Request) -> None:
     authorization = request.headers.get("Authorization")
     if authorization and authorization.lower().startswith("bearer"):
         token = authorization[7:]
-        decrypted = decrypt(token)
-        if (
-            decrypted
-            and decrypted["expiration"] > utc_timestamp()
-            and TokenRedis.hget(f"{decrypted['id']}:{token}")
-            and (user := User.Collection.find_by_id(decrypted["id"]))
-            and (root := NodeAnchor.Collection.find_by_id(user.root_id))
+        key = fingerprint(token)
+        if (user := PRINCIPAL_CACHE.get(key)) is None:
+            # token may be revoked while being looked up
+            epoch = PRINCIPAL_CACHE.epoch
+            if (
+                (decrypted := decrypt(token))
+                and decrypted["expiration"] > utc_timestamp()
+                and TokenRedis.has_token(decrypted["id"], token)
+                and (user := User.Collection.find_by_id(decrypted["id"]))
+                and PRINCIPAL_CACHE.enabled
+            ):
+                PRINCIPAL_CACHE.set(key, decrypted["expiration"], user, epoch)
+
+        # root is always loaded fresh (or from invalidated anchor cache)
+        if user and (
+            root := ANCHOR_CACHE.find_by_id(NodeAnchor.Collection, user.root_id)
         ):
             request._user = user  # type: ignore[attr-defined]
             request._root = root  # type: ignore[attr-defined]
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 from random import choice
 from string import ascii_letters, digits
 
@@ -13,6 +14,11 @@ def random_string(length: int) -> str:
     return "".join(choice(ascii_letters + digits) for _ in range(length))
 
 
+def fingerprint(data: str) -> str:
+    """Return short digest of data such as tokens."""
+    return blake2b(data.encode(), digest_size=16).hexdigest()
+
+
 def utc_datetime(**addons: int) -> datetime:
     """Get current datetime with option to add additional timedelta."""
     return datetime.now(tz=timezone.utc) + timedelta(**addons)
@@ -29,6 +35,7 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "Emailer",
     "SendGridEmailer",
+    "fingerprint",
     "random_string",
     "utc_datetime",
     "utc_timestamp",
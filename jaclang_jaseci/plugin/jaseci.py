@@ -35,6 +35,7 @@ from ..core.architype import (
     Anchor,
     Architype,
     BaseAnchor,
+    DISPATCH_TABLES,
     EdgeArchitype,
     GenericEdge,
     NodeAnchor,
@@ -95,6 +96,8 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
         methods: list = specs.methods or []
         as_query: str | list = specs.as_query or []
         auth: bool = specs.auth or False
+        prefetch: int = specs.prefetch or 0
+        projection: dict[str, list[str]] = specs.projection or {}
 
         query: dict[str, Any] = {}
         body: dict[str, Any] = {}
@@ -161,6 +164,9 @@ def populate_apis(cls: Type[WalkerArchitype]) -> None:
 
             wlk: WalkerAnchor = cls(**body, **pl["query"], **pl["files"]).__jac__
             if jctx.validate_access():
+                jctx.mem.__projection__ = projection
+                if prefetch:
+                    jctx.mem.prefetch(jctx.entry_node, prefetch)
                 wlk.spawn_call(jctx.entry_node)
                 jctx.close()
                 return ORJSONResponse(jctx.response(wlk.returns))
@@ -202,6 +208,8 @@ def specs(
     as_query: str | list = [],  # noqa: B006
     auth: bool = True,
     private: bool = False,
+    prefetch: int = 0,
+    projection: dict[str, list[str]] = {},  # noqa: B006
 ) -> Callable:
     """Walker Decorator."""
 
@@ -212,6 +220,8 @@ def specs(
             aq = as_query
             a = auth
             pv = private
+            pf = prefetch
+            pj = projection
 
             class __specs__(DefaultSpecs):  # noqa: N801
                 path: str = p
@@ -219,6 +229,8 @@ def specs(
                 as_query: str | list = aq
                 auth: bool = a
                 private: bool = pv
+                prefetch: int = pf
+                projection: dict[str, list[str]] = pj
 
             cls.__specs__ = __specs__  # type: ignore[attr-defined]
 
@@ -239,6 +251,8 @@ class DefaultSpecs:
     as_query: str | list[str] = []
     auth: bool = True
     private: bool = False
+    prefetch: int = 0
+    projection: dict[str, list[str]] = {}
 
 
 class JacPlugin:
@@ -289,6 +303,9 @@ class JacPlugin:
                 exit_funcs.update(new_exit_funcs)
                 cls._jac_exit_funcs_ = list(exit_funcs.values())
 
+            # abilities may have been (re)registered
+            DISPATCH_TABLES.clear()
+
             inner_init = cls.__init__  # type: ignore
 
             @wraps(inner_init)
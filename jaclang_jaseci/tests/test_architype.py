@@ -0,0 +1,205 @@
+"""JacLang Jaseci Architype Test."""
+
+from copy import copy, deepcopy
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pickle import dumps, loads
+from typing import TYPE_CHECKING
+from unittest import TestCase
+
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+
+from ..core.architype import (  # noqa: I202
+    AccessLevel,
+    AnchorState,
+    BaseArchitype,
+    DEFAULT_PERMISSION,
+    EdgeAnchor,
+    GenericEdge,
+    NodeAnchor,
+    Permission,
+    architype_indexes,
+    architype_to_dataclass,
+    serialize,
+    track,
+    type_filtered,
+)
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+
+@dataclass
+class Payload:
+    """Dataclass with hints that can't be resolved at runtime."""
+
+    amount: "Decimal | None" = None
+    tags: list[str] = field(default_factory=list)
+    created: datetime = field(default_factory=datetime.now)
+
+
+class IndexTest(TestCase):
+    """Declared architype index tests."""
+
+    def test_root_prefix(self) -> None:
+        """Test indexes are scoped to root unless unique."""
+
+        class Base(BaseArchitype):
+            pass
+
+        class Person(Base):
+            class __specs__:  # noqa: N801
+                indexes = ["age", {"keys": ["email"], "unique": True}]
+
+        self.assertEqual(
+            [
+                {
+                    "name": "Person_root_1_architype.age_1",
+                    "keys": [("root", 1), ("architype.age", 1)],
+                    "partialFilterExpression": {"name": "Person"},
+                },
+                {
+                    "name": "Person_architype.email_1",
+                    "keys": [("architype.email", 1)],
+                    "unique": True,
+                    "partialFilterExpression": {"name": "Person"},
+                },
+            ],
+            architype_indexes(Base),
+        )
+
+
+class PermissionTest(TestCase):
+    """Shared default permission tests."""
+
+    def anchor(self) -> NodeAnchor:
+        """Create anchor with default permission."""
+        anchor = object.__new__(NodeAnchor)
+        anchor.access = DEFAULT_PERMISSION
+        return anchor
+
+    def test_copy(self) -> None:
+        """Test copies keep single default permission."""
+        self.assertIs(DEFAULT_PERMISSION, copy(DEFAULT_PERMISSION))
+        self.assertIs(DEFAULT_PERMISSION, deepcopy(DEFAULT_PERMISSION))
+        self.assertIs(DEFAULT_PERMISSION, loads(dumps(DEFAULT_PERMISSION)))
+        self.assertEqual(
+            {"all": AccessLevel.NO_ACCESS, "roots": {"anchors": {}}},
+            asdict(DEFAULT_PERMISSION),
+        )
+
+    def test_direct_mutation(self) -> None:
+        """Test direct changes never reach default permission."""
+        anchor = self.anchor()
+        self.assertIs(DEFAULT_PERMISSION, anchor.peek_access())
+
+        anchor.access.roots.anchors["n::1"] = AccessLevel.READ
+        anchor.access.all = AccessLevel.WRITE
+        self.assertIsNot(DEFAULT_PERMISSION, anchor.access)
+        self.assertEqual(AccessLevel.WRITE, anchor.peek_access().all)
+        self.assertEqual({}, DEFAULT_PERMISSION.roots.anchors)
+        self.assertEqual(AccessLevel.NO_ACCESS, DEFAULT_PERMISSION.all)
+        self.assertEqual(Permission(), self.anchor().access)
+
+    def test_shared_permission_is_read_only(self) -> None:
+        """Test default permission can't be changed."""
+        with self.assertRaises(TypeError):
+            DEFAULT_PERMISSION.roots.anchors["n::1"] = AccessLevel.READ
+        with self.assertRaises(TypeError):
+            DEFAULT_PERMISSION.all = AccessLevel.WRITE
+
+
+class SerializeTest(TestCase):
+    """Architype field serialization tests."""
+
+    def test_unresolved_hints(self) -> None:
+        """Test dataclass is serialized by value if its hints can't be resolved."""
+        payload = Payload(tags=["a"])
+        data = serialize(payload)
+        self.assertEqual(
+            {"amount": None, "tags": ["a"], "created": payload.created}, data
+        )
+        self.assertIsNot(payload.tags, data["tags"])
+        self.assertEqual(payload, architype_to_dataclass(Payload, data))
+
+
+class TrackTest(TestCase):
+    """Tracked container tests."""
+
+    def test_shared(self) -> None:
+        """Test container shared by anchors flags fields of both."""
+        first, second = AnchorState(), AnchorState()
+        items, trackable = track([1], (first, "items"))
+        self.assertTrue(trackable)
+        self.assertIs(items, track(items, (second, "others"))[0])
+        track(items, (first, "items"))
+        self.assertEqual(2, len(items.__trackers__))
+
+        items.append(2)
+        self.assertEqual({"items"}, first.dirty)
+        self.assertEqual({"others"}, second.dirty)
+
+    def test_nested(self) -> None:
+        """Test nested container also held by other field flags both fields."""
+        first, second = AnchorState(), AnchorState()
+        data, _ = track({"items": [1]}, (first, "data"))
+        items, _ = track(data["items"], (second, "items"))
+        self.assertIs(data["items"], items)
+
+        items.append(2)
+        self.assertEqual({"data"}, first.dirty)
+        self.assertEqual({"items"}, second.dirty)
+
+        second.dirty = None
+        data["other"] = 1
+        self.assertIsNone(second.dirty)
+
+
+class TypeFilteredTest(TestCase):
+    """Edge type pre-filter tests."""
+
+    def edges(self) -> list[EdgeAnchor]:
+        """Create unloaded edges."""
+        edges = []
+        for name in ("GenericEdge", "UnknownEdge"):
+            edge = object.__new__(EdgeAnchor)
+            edge.name = name
+            edges.append(edge)
+        return edges
+
+    def test_isinstance_filter(self) -> None:
+        """Test edges are excluded via their type."""
+        edges = self.edges()
+        self.assertEqual(
+            edges[1:],
+            type_filtered(
+                edges, lambda x: [i for i in x if not isinstance(i, GenericEdge)]
+            ),
+        )
+        self.assertEqual(
+            edges,
+            type_filtered(
+                edges, lambda x: [i for i in x if isinstance(i, GenericEdge)]
+            ),
+        )
+
+    def test_unsafe_filter(self) -> None:
+        """Test edges are never excluded by filters that can't be decided by type."""
+        edges = self.edges()
+
+        def is_generic(edge: object) -> bool:
+            return type(edge) is GenericEdge
+
+        self.assertEqual(
+            edges,
+            type_filtered(edges, lambda x: [i for i in x if type(i) is GenericEdge]),
+        )
+        self.assertEqual(
+            edges, type_filtered(edges, lambda x: [i for i in x if is_generic(i)])
+        )
+        self.assertEqual(
+            edges, type_filtered(edges, lambda x: [i for i in x if i != x[0]])
+        )
+        self.assertEqual(
+            edges, type_filtered(edges, lambda x: [i for i in x if i is not x[0]])
+        )
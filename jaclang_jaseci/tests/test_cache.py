@@ -0,0 +1,157 @@
+"""JacLang Jaseci Anchor Cache Test."""
+
+from typing import Any, Callable, Generator
+from unittest import TestCase
+
+from bson import ObjectId
+
+from fakeredis import FakeRedis
+
+from ..core import cache
+from ..core.cache import AnchorCache
+from ..jaseci.datasources import AnchorRedis, Redis
+
+
+class Documents:
+    """Collection stub that runs `on_read` while each document is being read."""
+
+    __codec_options__ = None
+    __excluded_obj__ = None
+    docs: list[dict] = []
+    on_read: Callable[[], Any] = staticmethod(lambda: None)
+
+    @classmethod
+    def collection(cls) -> type["Documents"]:
+        """Return itself as pymongo collection."""
+        return cls
+
+    @classmethod
+    def find(
+        cls, filter: dict, projection: Any = None, session: Any = None  # noqa: ANN401
+    ) -> Generator[dict, None, None]:
+        """Read documents."""
+        for doc in cls.docs:
+            cls.on_read()
+            yield doc
+
+    @classmethod
+    def find_one(
+        cls, filter: dict, projection: Any = None, session: Any = None  # noqa: ANN401
+    ) -> dict | None:
+        """Read document."""
+        return next(cls.find(filter, projection, session), None)
+
+    @classmethod
+    def __document__(cls, doc: dict) -> dict:
+        """Return document as is."""
+        return doc
+
+
+class AnchorCacheTest(TestCase):
+    """Anchor cache coherence tests."""
+
+    def setUp(self) -> None:
+        """Use isolated redis."""
+        self.redis = Redis.__redis__
+        Redis.__redis__ = FakeRedis()
+        self.id = ObjectId()
+        Documents.docs = [{"_id": self.id, "val": 0}]
+        self.cache = AnchorCache(size=10, ttl=60, redis=True)
+
+    def tearDown(self) -> None:
+        """Restore redis."""
+        if listener := self.cache.__listener__:
+            listener.stop()
+        Documents.on_read = staticmethod(lambda: None)
+        Redis.__redis__ = self.redis
+
+    def reads(self, cache: AnchorCache) -> int:
+        """Find document twice and count datasource reads."""
+        reads = []
+        Documents.on_read = staticmethod(lambda: reads.append(True))
+        for _ in range(2):
+            self.assertEqual(Documents.docs, list(cache.find(Documents, [self.id])))
+        return len(reads)
+
+    def test_invalidation_from_other_worker_during_read(self) -> None:
+        """Test document read before other worker's invalidation isn't shared."""
+        Documents.on_read = staticmethod(lambda: AnchorRedis.invalidate([str(self.id)]))
+        self.assertEqual(Documents.docs, list(self.cache.find(Documents, [self.id])))
+        self.assertEqual([None], AnchorRedis.get_docs([str(self.id)]))
+
+        # fresh reads are shared again once tombstone expires
+        Documents.on_read = staticmethod(lambda: None)
+        Redis.get_rd().delete(AnchorRedis.key(str(self.id)))
+        self.cache.clear()
+        list(self.cache.find(Documents, [self.id]))
+        self.assertIsNotNone(AnchorRedis.get_docs([str(self.id)])[0])
+
+    def test_invalidation_from_same_worker_during_read(self) -> None:
+        """Test document read before local invalidation isn't cached."""
+        Documents.on_read = staticmethod(lambda: self.cache.invalidate([self.id]))
+        self.assertEqual(Documents.docs, list(self.cache.find(Documents, [self.id])))
+        self.assertIsNone(self.cache.get(self.id))
+        self.assertEqual([None], AnchorRedis.get_docs([str(self.id)]))
+
+    def test_stale_document_is_not_overwritten(self) -> None:
+        """Test invalidation replaces previously shared document."""
+        list(self.cache.find(Documents, [self.id]))
+        self.assertIsNotNone(AnchorRedis.get_docs([str(self.id)])[0])
+
+        AnchorRedis.invalidate([str(self.id)])
+        self.assertFalse(AnchorRedis.set_doc(str(self.id), b"stale", 60))
+        self.assertEqual([None], AnchorRedis.get_docs([str(self.id)]))
+
+    def test_pinned(self) -> None:
+        """Test pinned document is reused until invalidated."""
+        self.cache = AnchorCache(size=0, ttl=60, redis=True)
+        self.cache.pin([self.id])
+        self.assertEqual(1, self.reads(self.cache))
+        self.cache.invalidate([self.id])
+        self.assertEqual(1, self.reads(self.cache))
+
+    def test_pin_without_redis(self) -> None:
+        """Test nothing is pinned if other workers' updates can't be received."""
+        self.cache = AnchorCache(size=0, ttl=60, redis=False)
+        self.cache.pin([self.id])
+        self.assertEqual(2, self.reads(self.cache))
+        self.assertIsNone(self.cache.__listener__)
+
+
+class AnchorCacheLimitTest(TestCase):
+    """Anchor cache size and expiration tests."""
+
+    def setUp(self) -> None:
+        """Use controllable clock."""
+        self.now = 100.0
+        self.addCleanup(setattr, cache, "monotonic", cache.monotonic)
+        cache.monotonic = lambda: self.now
+        self.cache = AnchorCache(size=2, ttl=60, redis=False)
+        self.ids = [ObjectId() for _ in range(3)]
+
+    def test_lru_eviction(self) -> None:
+        """Test least recently used document is evicted first."""
+        self.cache.set(self.ids[0], b"0", self.cache.epoch)
+        self.cache.set(self.ids[1], b"1", self.cache.epoch)
+        self.assertEqual(b"0", self.cache.get(self.ids[0]))
+        self.cache.set(self.ids[2], b"2", self.cache.epoch)
+
+        self.assertEqual([self.ids[0], self.ids[2]], list(self.cache.__docs__))
+        self.assertIsNone(self.cache.get(self.ids[1]))
+
+    def test_ttl_expiry(self) -> None:
+        """Test document expires after ttl and is removed on access."""
+        self.cache.set(self.ids[0], b"0", self.cache.epoch)
+        self.now += 59.9
+        self.assertEqual(b"0", self.cache.get(self.ids[0]))
+
+        self.now += 0.2
+        self.assertIsNone(self.cache.get(self.ids[0]))
+        self.assertEqual({}, dict(self.cache.__docs__))
+
+    def test_stale_epoch(self) -> None:
+        """Test document read before an invalidation isn't cached."""
+        epoch = self.cache.epoch
+        self.cache.forget([self.ids[0]])
+        self.cache.set(self.ids[0], b"0", epoch)
+        self.assertIsNone(self.cache.get(self.ids[0]))
@@ -0,0 +1,491 @@
+"""JacLang Jaseci Memory Test."""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Generator
+from unittest import TestCase
+
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+from jaclang.compiler.constant import EdgeDir
+from jaclang.plugin.feature import JacFeature as Jac
+from jaclang.runtimelib.context import EXECUTION_CONTEXT, ExecutionContext
+
+from ..core import architype
+from ..core.architype import (  # noqa: I202
+    AccessLevel,
+    DISPATCH_TABLES,
+    EDGE_BUCKET_SIZE,
+    EdgeAnchor,
+    EdgeBucket,
+    NodeAnchor,
+    NodeArchitype,
+    Root,
+    WalkerArchitype,
+)
+from ..core.cache import ANCHOR_CACHE
+from ..core.context import JASECI_CONTEXT, JaseciContext
+from ..core.memory import NO_GRANT
+from ..jaseci import FastAPI
+
+FastAPI.enable()
+
+SCRIPTS = Path(__file__).parents[2] / "scripts"
+
+
+@Jac.make_node(on_entry=[], on_exit=[])
+@dataclass(eq=False)
+class Item(NodeArchitype):
+    """Test node."""
+
+    val: int = 0
+
+
+@Jac.make_walker(
+    on_entry=[Jac.DSFunc("enter_root", Root), Jac.DSFunc("enter_item", Item)],
+    on_exit=[],
+)
+@dataclass(eq=False)
+class visit_items(WalkerArchitype):  # noqa: N801
+    """Test walker that collects values of items connected to root."""
+
+    vals: list[int]
+
+    class __specs__:  # noqa: N801
+        private: bool = True
+
+    def enter_root(self, here: Root) -> None:
+        """Visit every item."""
+        Jac.visit_node(self, Jac.edge_ref(here, None, EdgeDir.OUT, None, False))
+
+    def enter_item(self, here: Item) -> None:
+        """Collect value."""
+        self.vals.append(here.val)
+
+
+class MemoryTestCase(TestCase):
+    """Run tests as requests of their own root."""
+
+    def setUp(self) -> None:
+        """Create root."""
+        if not EXECUTION_CONTEXT.get(None):
+            ExecutionContext.create()
+
+        root = Root().__jac__
+        NodeAnchor.Collection.insert_one(root.serialize())
+        self.root_id = root.id
+        self.roots = [root.id]
+        self.request()
+
+    def tearDown(self) -> None:
+        """Save last request and remove documents of created roots."""
+        self.close()
+        nodes = [
+            node["_id"]
+            for node in NodeAnchor.Collection.collection().find(
+                {"$or": [{"root": {"$in": self.roots}}, {"_id": {"$in": self.roots}}]},
+                {"_id": True},
+            )
+        ]
+        NodeAnchor.Collection.delete({"_id": {"$in": nodes}})
+        EdgeAnchor.Collection.delete({"root": {"$in": self.roots}})
+        EdgeBucket.Collection.delete({"node": {"$in": nodes}})
+        ANCHOR_CACHE.invalidate(nodes)
+
+    def close(self) -> None:
+        """Save current request."""
+        if jctx := JASECI_CONTEXT.get(None):
+            jctx.close()
+            JASECI_CONTEXT.set(None)
+
+    def request(self, root_id: Any = None) -> JaseciContext:  # noqa: ANN401
+        """Save current request and start new one as root."""
+        self.close()
+        root = NodeAnchor.Collection.find_by_id(root_id or self.root_id)
+        return JaseciContext.create(SimpleNamespace(_root=root))  # type: ignore[arg-type]
+
+    def connect(self, left: NodeArchitype, *right: NodeArchitype) -> None:
+        """Connect nodes via generic edges."""
+        Jac.connect(left, list(right), Jac.build_edge(False, None, None), False)
+
+    @contextmanager
+    def queries(self) -> Generator[list[str], None, None]:
+        """Record datasource lookups of anchors."""
+        calls: list[str] = []
+        find, find_by_id = ANCHOR_CACHE.find, ANCHOR_CACHE.find_by_id
+
+        def _find(*args: Any) -> Any:  # noqa: ANN401
+            calls.append("find")
+            return find(*args)
+
+        def _find_by_id(*args: Any) -> Any:  # noqa: ANN401
+            calls.append("find_by_id")
+            return find_by_id(*args)
+
+        ANCHOR_CACHE.find = _find  # type: ignore[method-assign]
+        ANCHOR_CACHE.find_by_id = _find_by_id  # type: ignore[method-assign]
+        try:
+            yield calls
+        finally:
+            del ANCHOR_CACHE.find, ANCHOR_CACHE.find_by_id
+
+
+class FrontierTest(MemoryTestCase):
+    """Walker frontier prefetch tests."""
+
+    def setUp(self) -> None:
+        """Connect items to root."""
+        super().setUp()
+        self.connect(Jac.get_root(), *(Item(val=idx) for idx in range(5)))
+        self.request()
+
+    def hop(self) -> list[str]:
+        """Get expected lookups of a hop from root."""
+        if Jac.get_root().__jac__.__dict__.get("bucketed"):
+            # edges of bucketed nodes are found via edge collection
+            return ["find"]
+        return ["find", "find"]
+
+    def test_edge_ref(self) -> None:
+        """Test edges and nodes of a hop are loaded with one query each."""
+        with self.queries() as calls:
+            items = Jac.edge_ref(Jac.get_root(), None, EdgeDir.OUT, None, False)
+            vals = sorted(item.val for item in items)
+
+        self.assertEqual(list(range(5)), vals)
+        self.assertEqual(self.hop(), calls)
+
+    def test_visit(self) -> None:
+        """Test walker visiting fan-out doesn't query per node."""
+        walker = visit_items(vals=[])
+        with self.queries() as calls:
+            Jac.spawn_call(walker, Jac.get_root())
+
+        self.assertEqual(list(range(5)), sorted(walker.vals))
+        self.assertEqual(self.hop(), calls)
+
+
+class EdgeBucketTest(MemoryTestCase):
+    """Edge buckets of nodes with many edges tests."""
+
+    def setUp(self) -> None:
+        """Use small buckets."""
+        self.addCleanup(setattr, architype, "EDGE_BUCKET_SIZE", EDGE_BUCKET_SIZE)
+        architype.EDGE_BUCKET_SIZE = 3
+        super().setUp()
+
+    def buckets(self) -> list[int]:
+        """Get stored edge counts of root's buckets."""
+        counts = []
+        for bucket in EdgeBucket.Collection.collection().find({"node": self.root_id}):
+            self.assertEqual(bucket["count"], len(bucket["edges"]))
+            counts.append(bucket["count"])
+        return sorted(counts)
+
+    def add(self, count: int) -> None:
+        """Connect items to root and save."""
+        self.connect(Jac.get_root(), *(Item() for _ in range(count)))
+        self.request()
+
+    def test_threshold(self) -> None:
+        """Test edges are moved to buckets only once they exceed bucket size."""
+        self.add(3)
+        root = NodeAnchor.Collection.collection().find_one(self.root_id)
+        self.assertFalse(root.get("bucketed"))
+        self.assertEqual(3, len(root["edges"]))
+        self.assertEqual([], self.buckets())
+
+        self.add(1)
+        root = NodeAnchor.Collection.collection().find_one(self.root_id)
+        self.assertTrue(root["bucketed"])
+        self.assertEqual([], root["edges"])
+        self.assertEqual([1, 3], self.buckets())
+        self.assertEqual(4, len(Jac.get_root().__jac__.edges))
+
+    def test_no_overfill(self) -> None:
+        """Test added edges never overfill partially filled bucket."""
+        self.add(5)
+        self.assertEqual([2, 3], self.buckets())
+        self.add(2)
+        self.assertEqual([2, 2, 3], self.buckets())
+        self.add(1)
+        self.assertEqual([2, 3, 3], self.buckets())
+        self.assertEqual(8, len(Jac.get_root().__jac__.edges))
+
+
+class DirectedEdgesTest(MemoryTestCase):
+    """Edges of bucketed nodes loaded per direction tests."""
+
+    def setUp(self) -> None:
+        """Connect hub with buckets between root and items."""
+        self.addCleanup(setattr, architype, "EDGE_BUCKET_SIZE", EDGE_BUCKET_SIZE)
+        architype.EDGE_BUCKET_SIZE = 2
+        super().setUp()
+        hub = Item(val=-1)
+        items = [Item(val=idx) for idx in range(3)]
+        self.connect(Jac.get_root(), hub)
+        self.connect(hub, *items)
+        self.connect(items[0], hub)
+        self.hub_id = hub.__jac__.id
+        self.request()
+
+    def hub(self) -> NodeAnchor:
+        """Load hub without its edges."""
+        hub = JaseciContext.get().mem.find_by_id(
+            NodeAnchor.ref(f"n:Item:{self.hub_id}")
+        )
+        assert hub and hub.bucketed
+        return hub
+
+    def test_direction(self) -> None:
+        """Test edges of one direction are loaded without buckets."""
+        hub = self.hub()
+        sources = Jac.edge_ref(hub.architype, None, EdgeDir.IN, None, False)
+        targets = Jac.edge_ref(hub.architype, None, EdgeDir.OUT, None, False)
+        self.assertNotIn("edges", hub.__dict__)
+
+        self.assertEqual([0], [node.val for node in sources if isinstance(node, Item)])
+        self.assertEqual(1, len([node for node in sources if isinstance(node, Root)]))
+        self.assertEqual([0, 1, 2], sorted(node.val for node in targets))
+        self.assertEqual(5, len(hub.edges))
+
+    def test_unsaved_changes(self) -> None:
+        """Test connected and disconnected edges are included before saving."""
+        hub = self.hub()
+        item = Jac.edge_ref(hub.architype, None, EdgeDir.OUT, None, False)[0]
+        Jac.disconnect(hub.architype, item, EdgeDir.OUT, None)
+        self.connect(hub.architype, Item(val=3))
+        # as if edges were never loaded
+        del hub.edges
+
+        targets = Jac.edge_ref(hub.architype, None, EdgeDir.OUT, None, False)
+        self.assertEqual(3, len(targets))
+        self.assertIn(3, [node.val for node in targets])
+
+
+class DispatchTest(MemoryTestCase):
+    """Ability dispatch table tests."""
+
+    def test_reregistered(self) -> None:
+        """Test abilities registered after first dispatch are triggered."""
+        item = Item()
+        self.connect(Jac.get_root(), item)
+
+        @Jac.make_walker(on_entry=[Jac.DSFunc("first", Item)], on_exit=[])
+        @dataclass(eq=False)
+        class collect(WalkerArchitype):  # noqa: N801
+            calls: list[str]
+
+            class __specs__:  # noqa: N801
+                private: bool = True
+
+            def first(self, here: Item) -> None:
+                self.calls.append("first")
+
+            def second(self, here: Item) -> None:
+                self.calls.append("second")
+
+        walker = collect(calls=[])
+        Jac.spawn_call(walker, item)
+        self.assertEqual(["first"], walker.calls)
+        self.assertIn((collect, Item), DISPATCH_TABLES)
+
+        Jac.make_walker(on_entry=[Jac.DSFunc("second", Item)], on_exit=[])(collect)
+        self.assertNotIn((collect, Item), DISPATCH_TABLES)
+
+        walker = collect(calls=[])
+        Jac.spawn_call(walker, item)
+        self.assertEqual(["first", "second"], walker.calls)
+
+
+class PrefetchTest(MemoryTestCase):
+    """Neighborhood prefetch tests."""
+
+    def setUp(self) -> None:
+        """Connect two levels of items to root."""
+        super().setUp()
+        for idx in range(3):
+            item = Item(val=idx)
+            self.connect(Jac.get_root(), item)
+            self.connect(item, *(Item(val=10 * idx + sub) for sub in (10, 11)))
+        self.request()
+
+    def test_prefetch(self) -> None:
+        """Test traversing prefetched neighborhood doesn't query."""
+        jctx = JaseciContext.get()
+        try:
+            jctx.mem.prefetch(jctx.root, 2)
+        except NotImplementedError:
+            self.skipTest("datasource doesn't support $lookup pipelines")
+
+        with self.queries() as calls:
+            items = Jac.edge_ref(jctx.root.architype, None, EdgeDir.OUT, None, False)
+            subs = Jac.edge_ref(items, None, EdgeDir.OUT, None, False)
+
+        self.assertEqual([0, 1, 2], sorted(item.val for item in items))
+        self.assertEqual([10, 11, 20, 21, 30, 31], sorted(item.val for item in subs))
+        self.assertEqual([], calls)
+
+
+class IdentityTest(MemoryTestCase):
+    """Single anchor instance per id tests."""
+
+    def setUp(self) -> None:
+        """Connect item to root."""
+        super().setUp()
+        item = Item(val=1)
+        self.connect(Jac.get_root(), item)
+        self.item_id = item.__jac__.id
+        self.request()
+
+    def ref(self) -> NodeAnchor:
+        """Get reference of item."""
+        return NodeAnchor.ref(f"n:Item:{self.item_id}")
+
+    def test_intern(self) -> None:
+        """Test references and finds of same id resolve to same instance."""
+        mem = JaseciContext.get().mem
+        ref = self.ref()
+        self.assertIs(ref, self.ref())
+        self.assertFalse(ref.is_populated())
+
+        self.assertIs(ref, mem.find_by_id(self.ref()))
+        self.assertIs(ref, mem.find_one(self.ref()))
+        self.assertIs(ref, ref.architype.__jac__)
+        self.assertIs(ref, self.ref())
+        self.assertEqual(1, ref.architype.val)
+
+    def test_adopt(self) -> None:
+        """Test loaded anchor is merged to reference and never replaces changes."""
+        mem = JaseciContext.get().mem
+        ref = self.ref()
+        loaded = NodeAnchor.Collection.find_by_id(self.item_id)
+        assert loaded
+        self.assertIs(ref, mem.adopt(loaded))
+        self.assertIs(ref, ref.architype.__jac__)
+        self.assertEqual(1, ref.architype.val)
+
+        ref.architype.val = 2
+        reloaded = NodeAnchor.Collection.find_by_id(self.item_id)
+        assert reloaded
+        self.assertIs(ref, mem.adopt(reloaded))
+        self.assertIs(ref, mem.find_by_id(self.ref()))
+        self.assertEqual(2, ref.architype.val)
+
+        self.request()
+        item = JaseciContext.get().mem.find_by_id(self.ref())
+        assert item
+        self.assertEqual(2, item.architype.val)
+
+
+class RootAccessTest(MemoryTestCase):
+    """Access of other root's graph tests."""
+
+    def setUp(self) -> None:
+        """Connect items to other root."""
+        super().setUp()
+        other = Root().__jac__
+        NodeAnchor.Collection.insert_one(other.serialize())
+        self.other_id = other.id
+        self.roots.append(other.id)
+
+        self.request(other.id)
+        items = [Item(val=idx) for idx in range(3)]
+        self.connect(Jac.get_root(), *items)
+        self.item_ids = [item.__jac__.id for item in items]
+        self.request()
+
+    def items(self) -> list[NodeAnchor]:
+        """Load items of other root."""
+        return list(
+            JaseciContext.get().mem.find(
+                [NodeAnchor.ref(f"n:Item:{id}") for id in self.item_ids]
+            )
+        )
+
+    def test_memoized(self) -> None:
+        """Test access of other root is loaded once per request."""
+        jctx = JaseciContext.get()
+        items = self.items()
+        with self.queries() as calls:
+            jctx.mem.check_roots(jctx.root, items)
+            jctx.mem.check_roots(jctx.root, items)
+            for item in items:
+                self.assertFalse(jctx.root.has_read_access(item))
+            self.assertEqual(NO_GRANT, jctx.mem.root_access(jctx.root, self.other_id))
+
+        self.assertEqual(["find"], calls)
+
+    def test_invalidated(self) -> None:
+        """Test access of other root is reloaded once it changes."""
+        jctx = JaseciContext.get()
+        items = self.items()
+        jctx.mem.check_roots(jctx.root, items)
+        self.assertFalse(jctx.root.has_read_access(items[0]))
+
+        other = jctx.mem.find_by_id(NodeAnchor.ref(f"n::{self.other_id}"))
+        assert other
+        other.allow_root(jctx.root)
+        with self.queries() as calls:
+            self.assertTrue(jctx.root.has_read_access(items[0]))
+            self.assertEqual(
+                (AccessLevel.NO_ACCESS, AccessLevel.READ),
+                jctx.mem.root_access(jctx.root, self.other_id),
+            )
+        self.assertEqual([], calls)
+
+        other.disallow_root(jctx.root)
+        self.assertFalse(jctx.root.has_read_access(items[0]))
+
+
+class MigrateEdgeRefsTest(MemoryTestCase):
+    """Edge ref format migration script tests."""
+
+    def setUp(self) -> None:
+        """Connect items to root."""
+        if not (script := SCRIPTS / "migrate_edge_refs.py").exists():
+            self.skipTest("scripts are not shipped")
+        spec = spec_from_file_location("migrate_edge_refs", script)
+        assert spec and spec.loader
+        module = module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self.migrate = module.migrate
+
+        super().setUp()
+        self.connect(Jac.get_root(), *(Item(val=idx) for idx in range(3)))
+        self.close()
+
+    def refs(self) -> list[str | bytes]:
+        """Get stored edge refs of root."""
+        refs = list(NodeAnchor.Collection.collection().find_one(self.root_id)["edges"])
+        for bucket in EdgeBucket.Collection.collection().find({"node": self.root_id}):
+            refs.extend(bucket["edges"])
+        return refs
+
+    def test_migrate(self) -> None:
+        """Test refs are converted to other format and dry run keeps them."""
+        current = architype.EDGE_REF_FORMAT
+        other = "string" if current == "compact" else "compact"
+        self.addCleanup(self.migrate, current)
+
+        refs = self.refs()
+        self.assertEqual(3, len(refs))
+        self.assertGreaterEqual(self.migrate(other, dry_run=True), 1)
+        self.assertEqual(refs, self.refs())
+
+        self.assertGreaterEqual(self.migrate(other), 1)
+        self.assertEqual(0, self.migrate(other, dry_run=True))
+        migrated = self.refs()
+        self.assertNotEqual(refs, migrated)
+        self.assertEqual([EdgeAnchor.ref(ref).stored_ref for ref in refs], migrated)
+
+        self.request()
+        self.assertEqual(
+            [0, 1, 2],
+            sorted(
+                item.val
+                for item in Jac.edge_ref(Jac.get_root(), None, EdgeDir.OUT, None, False)
+            ),
+        )
@@ -0,0 +1,188 @@
+"""JacLang Jaseci Redis Store Test."""
+
+from time import sleep
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from fakeredis import FakeAsyncRedis, FakeRedis
+
+from ..jaseci.datasources import CodeRedis, Redis, TokenRedis
+from ..jaseci.datasources.redis import AsyncCodeRedis, AsyncRedis, AsyncTokenRedis
+from ..jaseci.utils import fingerprint, utc_timestamp
+
+
+class RedisTestCase(TestCase):
+    """Use isolated redis per test."""
+
+    def setUp(self) -> None:
+        """Use isolated redis."""
+        self.redis = Redis.__redis__
+        self.rd = Redis.__redis__ = FakeRedis()
+
+    def tearDown(self) -> None:
+        """Restore redis."""
+        Redis.__redis__ = self.redis
+
+
+class AsyncRedisTestCase(IsolatedAsyncioTestCase):
+    """Use isolated async redis per test."""
+
+    def setUp(self) -> None:
+        """Use isolated redis."""
+        self.redis = AsyncRedis.__redis__
+        self.rd = AsyncRedis.__redis__ = FakeAsyncRedis()
+
+    def tearDown(self) -> None:
+        """Restore redis."""
+        AsyncRedis.__redis__ = self.redis
+
+
+class TokenRedisTest(RedisTestCase):
+    """Token store tests."""
+
+    def test_add_token(self) -> None:
+        """Test token is stored as fingerprint that expires with token."""
+        expiration = utc_timestamp(hours=1)
+        self.assertTrue(TokenRedis.add_token("user", "token", expiration))
+
+        self.assertTrue(TokenRedis.has_token("user", "token"))
+        self.assertFalse(TokenRedis.has_token("user", "other"))
+        self.assertFalse(TokenRedis.has_token("other", "token"))
+        self.assertEqual(
+            [(fingerprint("token").encode(), expiration)],
+            self.rd.zrange(TokenRedis.key("user"), 0, -1, withscores=True),
+        )
+        self.assertAlmostEqual(
+            expiration - utc_timestamp(), self.rd.ttl(TokenRedis.key("user")), delta=2
+        )
+
+    def test_expired_tokens(self) -> None:
+        """Test expired tokens are rejected and pruned on next token."""
+        self.rd.zadd(TokenRedis.key("user"), {fingerprint("expired"): 1})
+        self.assertFalse(TokenRedis.has_token("user", "expired"))
+
+        expiration = utc_timestamp(hours=1)
+        TokenRedis.add_token("user", "token", expiration)
+        self.assertEqual(
+            [fingerprint("token").encode()],
+            self.rd.zrange(TokenRedis.key("user"), 0, -1),
+        )
+
+        # key expires with its latest token
+        TokenRedis.add_token("user", "old", utc_timestamp() - 1)
+        self.assertFalse(self.rd.exists(TokenRedis.key("user")))
+        self.assertFalse(TokenRedis.has_token("user", "token"))
+
+    def test_revoke_tokens(self) -> None:
+        """Test every token of user is revoked."""
+        expiration = utc_timestamp(hours=1)
+        TokenRedis.add_token("user", "token1", expiration)
+        TokenRedis.add_token("user", "token2", expiration)
+        TokenRedis.add_token("other", "token3", expiration)
+
+        self.assertTrue(TokenRedis.revoke_tokens("user"))
+        self.assertFalse(TokenRedis.has_token("user", "token1"))
+        self.assertFalse(TokenRedis.has_token("user", "token2"))
+        self.assertTrue(TokenRedis.has_token("other", "token3"))
+        self.assertFalse(self.rd.exists(TokenRedis.__table__))
+
+    def test_legacy_tokens(self) -> None:
+        """Test tokens created before per user keys are still valid and revoked."""
+        TokenRedis.hset("user:legacy", True)
+        self.assertFalse(TokenRedis.has_token("user", "legacy"))
+
+        TokenRedis.__legacy__ = True
+        self.addCleanup(setattr, TokenRedis, "__legacy__", False)
+        TokenRedis.hset("other:legacy", True)
+        TokenRedis.add_token("user", "token", utc_timestamp(hours=1))
+        self.assertTrue(TokenRedis.has_token("user", "legacy"))
+        self.assertTrue(TokenRedis.has_token("user", "token"))
+
+        self.assertTrue(TokenRedis.revoke_tokens("user"))
+        self.assertFalse(TokenRedis.has_token("user", "legacy"))
+        self.assertFalse(TokenRedis.has_token("user", "token"))
+        self.assertTrue(TokenRedis.has_token("other", "legacy"))
+        self.assertEqual([b"other:legacy"], self.rd.hkeys(TokenRedis.__table__))
+
+
+class AsyncTokenRedisTest(AsyncRedisTestCase):
+    """Async token store tests."""
+
+    async def test_tokens(self) -> None:
+        """Test tokens share layout of sync store."""
+        expiration = utc_timestamp(hours=1)
+        self.assertTrue(await AsyncTokenRedis.add_token("user", "token", expiration))
+        await AsyncTokenRedis.add_token("other", "token", expiration)
+        self.assertTrue(await AsyncTokenRedis.has_token("user", "token"))
+        self.assertFalse(await AsyncTokenRedis.has_token("user", "other"))
+        self.assertEqual(
+            [(fingerprint("token").encode(), expiration)],
+            await self.rd.zrange(TokenRedis.key("user"), 0, -1, withscores=True),
+        )
+
+        self.assertTrue(await AsyncTokenRedis.revoke_tokens("user"))
+        self.assertFalse(await AsyncTokenRedis.has_token("user", "token"))
+        self.assertTrue(await AsyncTokenRedis.has_token("other", "token"))
+
+    async def test_legacy_tokens(self) -> None:
+        """Test tokens created before per user keys are only checked if enabled."""
+        await AsyncTokenRedis.hset("user:legacy", True)
+        self.assertFalse(await AsyncTokenRedis.has_token("user", "legacy"))
+
+        AsyncTokenRedis.__legacy__ = True
+        self.addCleanup(setattr, AsyncTokenRedis, "__legacy__", False)
+        self.assertTrue(await AsyncTokenRedis.has_token("user", "legacy"))
+        self.assertTrue(await AsyncTokenRedis.revoke_tokens("user"))
+        self.assertFalse(await AsyncTokenRedis.has_token("user", "legacy"))
+
+
+class CodeRedisTest(RedisTestCase):
+    """Verification code store tests."""
+
+    def test_consume_code(self) -> None:
+        """Test code is only valid once."""
+        self.assertTrue(CodeRedis.add_code("code", 60))
+        self.assertFalse(CodeRedis.consume_code("other"))
+        self.assertTrue(CodeRedis.consume_code("code"))
+        self.assertFalse(CodeRedis.consume_code("code"))
+        self.assertFalse(self.rd.exists(CodeRedis.key("code")))
+
+    def test_expired_code(self) -> None:
+        """Test code is invalid once expired."""
+        CodeRedis.add_code("code", 1)
+        self.assertGreater(self.rd.ttl(CodeRedis.key("code")), 0)
+        sleep(1.1)
+        self.assertFalse(CodeRedis.consume_code("code"))
+
+    def test_legacy_code(self) -> None:
+        """Test codes created before per code keys are consumed once."""
+        CodeRedis.hset("code", True)
+        CodeRedis.hset("other", True)
+        self.assertFalse(CodeRedis.consume_code("code"))
+
+        CodeRedis.__legacy__ = True
+        self.addCleanup(setattr, CodeRedis, "__legacy__", False)
+        self.assertTrue(CodeRedis.consume_code("code"))
+        self.assertFalse(CodeRedis.consume_code("code"))
+        self.assertEqual([b"other"], self.rd.hkeys(CodeRedis.__table__))
+
+
+class AsyncCodeRedisTest(AsyncRedisTestCase):
+    """Async verification code store tests."""
+
+    async def test_consume_code(self) -> None:
+        """Test code is only valid once."""
+        self.assertTrue(await AsyncCodeRedis.add_code("code", 60))
+        self.assertGreater(await self.rd.ttl(CodeRedis.key("code")), 0)
+        self.assertFalse(await AsyncCodeRedis.consume_code("other"))
+        self.assertTrue(await AsyncCodeRedis.consume_code("code"))
+        self.assertFalse(await AsyncCodeRedis.consume_code("code"))
+
+    async def test_legacy_code(self) -> None:
+        """Test codes created before per code keys are only consumed if enabled."""
+        await AsyncCodeRedis.hset("code", True)
+        self.assertFalse(await AsyncCodeRedis.consume_code("code"))
+
+        AsyncCodeRedis.__legacy__ = True
+        self.addCleanup(setattr, AsyncCodeRedis, "__legacy__", False)
+        self.assertTrue(await AsyncCodeRedis.consume_code("code"))
+        self.assertFalse(await AsyncCodeRedis.consume_code("code"))
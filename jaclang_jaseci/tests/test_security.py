@@ -0,0 +1,84 @@
+"""JacLang Jaseci Security Test."""
+
+from time import sleep
+from unittest import TestCase
+
+from bson import ObjectId
+
+from fakeredis import FakeRedis
+
+import jaclang  # noqa: F401, I100 # register jac plugins before importing cores
+
+from ..jaseci.datasources import Redis  # noqa: I202
+from ..jaseci.models.user import User
+from ..jaseci.security import PrincipalCache
+
+
+class PrincipalCacheTest(TestCase):
+    """Authenticated principal cache tests."""
+
+    def setUp(self) -> None:
+        """Use isolated redis."""
+        self.redis = Redis.__redis__
+        Redis.__redis__ = FakeRedis()
+
+    def tearDown(self) -> None:
+        """Restore redis."""
+        Redis.__redis__ = self.redis
+
+    def user(self) -> User:
+        """Create user."""
+        return User(id=ObjectId(), email="a@b.c", password=b"", root_id=ObjectId())
+
+    def test_size_limit(self) -> None:
+        """Test least recently used entries are evicted."""
+        cache = PrincipalCache(ttl=60, size=2)
+        users = [self.user() for _ in range(3)]
+        cache.set("0", 2**40, users[0], cache.epoch)
+        cache.set("1", 2**40, users[1], cache.epoch)
+        self.assertIs(users[0], cache.get("0"))
+        cache.set("2", 2**40, users[2], cache.epoch)
+
+        self.assertEqual(["0", "2"], list(cache.__principals__))
+        self.assertEqual({str(users[0].id), str(users[2].id)}, set(cache.__users__))
+
+    def test_expired_entries_are_removed(self) -> None:
+        """Test expired entries and their user references are removed."""
+        cache = PrincipalCache(ttl=0.05, size=10)
+        user = self.user()
+        cache.set("0", 2**40, user, cache.epoch)
+        cache.set("1", 0, self.user(), cache.epoch)
+        self.assertIsNone(cache.get("1"))
+
+        sleep(0.1)
+        cache.set("2", 2**40, self.user(), cache.epoch)
+        self.assertEqual(["2"], list(cache.__principals__))
+        self.assertNotIn(str(user.id), cache.__users__)
+
+    def test_invalidate(self) -> None:
+        """Test invalidated user is removed."""
+        cache = PrincipalCache(ttl=60, size=10)
+        user = self.user()
+        cache.set("0", 2**40, user, cache.epoch)
+        cache.set("1", 2**40, user, cache.epoch)
+        cache.invalidate(user.id)
+        self.assertIsNone(cache.get("0"))
+        self.assertEqual({}, cache.__users__)
+
+    def test_invalidation_during_lookup(self) -> None:
+        """Test user loaded before its tokens are revoked isn't cached."""
+        cache = PrincipalCache(ttl=60, size=10)
+        user = self.user()
+        epoch = cache.epoch
+        cache.invalidate(user.id)
+        cache.set("0", 2**40, user, epoch)
+        self.assertIsNone(cache.get("0"))
+
+        # invalidation from other worker
+        epoch = cache.epoch
+        cache.forget([str(user.id)])
+        cache.set("0", 2**40, user, epoch)
+        self.assertIsNone(cache.get("0"))
+
+        cache.set("0", 2**40, user, cache.epoch)
+        self.assertIs(user, cache.get("0"))
@@ -152,6 +152,56 @@ class SimpleGraphTest(IsolatedAsyncioTestCase):
             for _idx, report in enumerate(res["reports"]):
                 self.assertEqual({"val": idx + _idx}, report["context"])
 
+    def trigger_traverse_graph_projected_test(self) -> None:
+        """Test Graph Traversion with projected nodes."""
+        for delta, val in [(10, 10), (-10, 0)]:
+            res = self.post_api("traverse_graph_projected", {"delta": delta})
+
+            self.assertEqual(200, res["status"])
+            self.assertEqual(1, res["reports"][0])
+            self.assertEqual({"val": 2}, res["reports"][1]["context"])
+
+            res = self.post_api("traverse_graph")
+
+            self.assertEqual(200, res["status"])
+            self.assertEqual({"val": val}, res["reports"][1]["context"])
+
+    def trigger_traverse_edge_pages_test(self) -> None:
+        """Test Paginated Edge Iteration."""
+        res = self.post_api("traverse_edge_pages")
+
+        self.assertEqual(200, res["status"])
+        self.assertEqual(2, len(res["reports"]))
+
+        root_page, b_page = res["reports"]
+        self.assertEqual(1, len(root_page))
+        self.assertTrue(root_page[0]["id"].startswith("n::"))
+        self.assertEqual({}, root_page[0]["context"])
+        self.assertEqual([{"val": 1}], [report["context"] for report in b_page])
+
+    def trigger_find_indexed_node_test(self) -> None:
+        """Test Indexed Node Lookup."""
+        res = self.post_api("find_indexed_node", {"val": 2})
+
+        self.assertEqual(200, res["status"])
+        self.assertEqual(1, len(res["reports"]))
+        self.assertEqual([{"val": 2}], [n["context"] for n in res["reports"][0]])
+
+        res = self.post_api("find_indexed_node", {"val": 3})
+
+        self.assertEqual(200, res["status"])
+        self.assertEqual([[]], res["reports"])
+
+        # other root's nodes are only found with read access
+        res = self.post_api(
+            "find_indexed_node",
+            {"val": 2, "root_id": self.users[0]["user"]["root_id"]},
+            user=1,
+        )
+
+        self.assertEqual(200, res["status"])
+        self.assertEqual([[]], res["reports"])
+
     def trigger_detach_node_test(self) -> None:
         """Test detach node."""
         res = self.post_api("detach_node")
@@ -481,6 +531,9 @@ class SimpleGraphTest(IsolatedAsyncioTestCase):
 
         self.trigger_create_graph_test()
         self.trigger_traverse_graph_test()
+        self.trigger_traverse_graph_projected_test()
+        self.trigger_traverse_edge_pages_test()
+        self.trigger_find_indexed_node_test()
         self.trigger_detach_node_test()
         self.trigger_update_graph_test()
 
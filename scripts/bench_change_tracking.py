@@ -0,0 +1,67 @@
+"""Microbenchmark of architype change detection: hash vs tracked (CHANGE_TRACKING)."""
+
+from dataclasses import dataclass, field
+from timeit import timeit
+
+import jaclang_jaseci  # noqa: F401, I100, I201
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+
+from jaclang_jaseci.core import architype
+from jaclang_jaseci.core.architype import NodeArchitype
+
+
+@dataclass(eq=False)
+class Large(NodeArchitype):
+    """Node with large container fields."""
+
+    val: int
+    name: str
+    arr: list
+    json: dict
+    tags: list[str] = field(default_factory=list)
+
+
+def build() -> Large:
+    """Build node with large container fields."""
+    return Large(
+        val=0,
+        name="large",
+        arr=[{"idx": i, "val": [i, i + 1]} for i in range(2000)],
+        json={str(i): {"val": i} for i in range(2000)},
+        tags=[f"tag{i}" for i in range(200)],
+    )
+
+
+def main(number: int = 200) -> None:
+    """Run benchmark."""
+    results = {}
+    for mode in ("hash", "tracked"):
+        architype.CHANGE_TRACKING = mode
+
+        node = build()
+        anchor = node.__jac__
+        anchor.sync_hash()
+
+        # correctness: unchanged, in place mutation and reassignment
+        assert not anchor.has_changed()
+        node.arr[10]["val"].append(0)
+        assert anchor.has_changed()
+        anchor.sync_hash()
+        node.val = 1
+        assert anchor.has_changed()
+        anchor.sync_hash()
+
+        # load: sync on populate, close: check unchanged anchor
+        load = timeit(anchor.sync_hash, number=number)
+        close = timeit(anchor.has_changed, number=number)
+        results[mode] = (load, close)
+
+    for mode, (load, close) in results.items():
+        print(
+            f"{mode:8} sync_hash: {load / number * 1e6:10.2f} us/op"
+            f" | has_changed: {close / number * 1e6:10.2f} us/op"
+        )
+
+
+if __name__ == "__main__":
+    main()
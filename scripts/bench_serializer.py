@@ -0,0 +1,67 @@
+"""Microbenchmark of architype serialization: dataclasses.asdict vs generated serializer."""
+
+from dataclasses import asdict, dataclass, field
+from timeit import timeit
+
+import jaclang_jaseci  # noqa: F401, I100, I201
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+
+from jaclang_jaseci.core.architype import NodeArchitype, ObjectArchitype, serializer
+
+
+@dataclass(eq=False)
+class Child(ObjectArchitype):
+    """Nested object."""
+
+    val: int
+    arr: list
+    json: dict
+
+
+@dataclass(eq=False)
+class Parent(Child):
+    """Nested object with child."""
+
+    child: Child
+
+
+@dataclass(eq=False)
+class Nested(NodeArchitype):
+    """Node with scalar, container and nested dataclass fields."""
+
+    val: int
+    name: str
+    arr: list
+    json: dict
+    parent: Parent
+    tags: list[str] = field(default_factory=list)
+
+
+def main(number: int = 20000) -> None:
+    """Run benchmark."""
+    node = Nested(
+        val=0,
+        name="nested",
+        arr=list(range(20)),
+        json={str(i): i for i in range(20)},
+        parent=Parent(
+            val=1,
+            arr=[1],
+            json={"a": 1},
+            child=Child(val=2, arr=[1, 2], json={"a": 1, "b": 2}),
+        ),
+        tags=[f"tag{i}" for i in range(10)],
+    )
+    assert asdict(node) == node.__serialize__()
+
+    ser = serializer(Nested)
+    baseline = timeit(lambda: asdict(node), number=number)
+    generated = timeit(lambda: ser(node), number=number)
+
+    print(f"dataclasses.asdict   : {baseline / number * 1e6:8.2f} us/op")
+    print(f"generated serializer : {generated / number * 1e6:8.2f} us/op")
+    print(f"speedup              : {baseline / generated:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
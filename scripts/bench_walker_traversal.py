@@ -0,0 +1,129 @@
+"""Microbenchmark of walker traversal engine: previous (jaclang) vs WalkerAnchor."""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import cast
+
+import jaclang_jaseci  # noqa: F401, I100, I201
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+
+from jaclang.runtimelib.architype import (  # noqa: I202
+    Anchor,
+    DSFunc,
+    WalkerAnchor as _WalkerAnchor,
+)
+
+from jaclang_jaseci.core.architype import NodeArchitype, WalkerAnchor, WalkerArchitype
+
+
+@dataclass(eq=False)
+class Vertex(NodeArchitype):
+    """Node holding its outgoing neighbors without edges."""
+
+    neighbors: list = field(default_factory=list)
+
+
+@dataclass(eq=False)
+class Traverse(WalkerArchitype):
+    """Walker that visits every neighbor and ignores the first `ignore` of them."""
+
+    ignore: int = 0
+    count: int = 0
+
+    def enter(self, here: Vertex) -> None:
+        """Visit neighbors."""
+        self.count += 1
+        if self.ignore:
+            self.__jac__.ignore_node(n.__jac__ for n in here.neighbors[: self.ignore])
+        self.__jac__.visit_node(n.__jac__ for n in here.neighbors)
+
+
+Vertex._jac_entry_funcs_ = Vertex._jac_exit_funcs_ = []
+Traverse._jac_entry_funcs_ = [DSFunc("enter", Vertex, Traverse.enter)]
+Traverse._jac_exit_funcs_ = []
+
+
+@dataclass(eq=False)
+class Other(NodeArchitype):
+    """Node never visited."""
+
+
+@dataclass(eq=False)
+class ManyAbilities(Traverse):
+    """Walker with abilities for other node types."""
+
+    def noop(self, here: Other) -> None:
+        """Never triggered."""
+
+
+ManyAbilities._jac_entry_funcs_ = [
+    DSFunc(f"noop{i}", Other, ManyAbilities.noop) for i in range(20)
+] + Traverse._jac_entry_funcs_
+ManyAbilities._jac_exit_funcs_ = [
+    DSFunc(f"noop{i}", Other, ManyAbilities.noop) for i in range(20)
+]
+
+
+@dataclass(eq=False, repr=False, kw_only=True)
+class ListWalkerAnchor(WalkerAnchor):
+    """Previous list based queue, ignore list and per hop trigger checks."""
+
+    visit_node = _WalkerAnchor.visit_node
+    ignore_node = _WalkerAnchor.ignore_node
+
+    def spawn_call(self, node: Anchor) -> WalkerArchitype:
+        """Invoke previous data spatial call."""
+        return cast(WalkerArchitype, _WalkerAnchor.spawn_call(self, node))
+
+
+def chain(size: int) -> Vertex:
+    """Build chain of `size` nodes."""
+    head = current = Vertex()
+    for _ in range(size - 1):
+        nxt = Vertex()
+        current.neighbors.append(nxt)
+        current = nxt
+    return head
+
+
+def fan_out(size: int) -> Vertex:
+    """Build root with `size` leaf nodes."""
+    return Vertex(neighbors=[Vertex() for _ in range(size)])
+
+
+def run(
+    root: Vertex, legacy: bool, ignore: int = 0, walker_cls: type[Traverse] = Traverse
+) -> tuple[float, int]:
+    """Spawn walker on root and return elapsed seconds and visited nodes."""
+    walker = walker_cls(ignore=ignore)
+    anchor = walker.__jac__
+    if legacy:
+        anchor.__class__ = ListWalkerAnchor
+        anchor.ignores = []  # type: ignore[assignment]
+
+    start = perf_counter()
+    anchor.spawn_call(root.__jac__)
+    return perf_counter() - start, walker.count
+
+
+def main() -> None:
+    """Run benchmark."""
+    cases: list[tuple[str, Vertex, int, type[Traverse]]] = [
+        ("chain 100k", chain(100_000), 0, Traverse),
+        ("fan-out 100k", fan_out(100_000), 0, Traverse),
+        ("fan-out 100k, ignore 200", fan_out(100_000), 200, Traverse),
+        ("fan-out 100k, 41 abilities", fan_out(100_000), 0, ManyAbilities),
+    ]
+    for name, root, ignore, walker_cls in cases:
+        legacy, legacy_count = run(root, True, ignore, walker_cls)
+        current, count = run(root, False, ignore, walker_cls)
+        assert legacy_count == count
+        print(
+            f"{name:28}: previous {legacy * 1e3:9.2f} ms"
+            f" | current {current * 1e3:9.2f} ms"
+            f" | speedup {legacy / current:6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
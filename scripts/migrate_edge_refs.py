@@ -0,0 +1,79 @@
+"""
+Convert stored edge refs of nodes and edge buckets to EDGE_REF_FORMAT (string|compact).
+
+Pass `--dry-run` to only count documents that would be converted.
+
+Run it with the same ANCHOR_CACHE_REDIS and REDIS_HOST as the servers so cached
+nodes are invalidated on every worker. Without ANCHOR_CACHE_REDIS, workers can't
+be notified: stop the servers first or expect stale nodes until ANCHOR_CACHE_TTL.
+"""
+
+from sys import argv
+from typing import Any
+
+from bson import ObjectId
+
+import jaclang_jaseci  # noqa: F401, I100, I201
+import jaclang  # noqa: F401, I100, I201 # register jac plugins before importing cores
+
+from jaclang_jaseci.core import architype  # noqa: I202
+from jaclang_jaseci.core.architype import EdgeAnchor, EdgeBucket, NodeAnchor
+from jaclang_jaseci.core.cache import ANCHOR_CACHE
+from jaclang_jaseci.jaseci.datasources import Collection
+
+from pymongo import DeleteMany, DeleteOne, InsertOne, UpdateMany, UpdateOne
+
+Operations = list[InsertOne[Any] | DeleteMany | DeleteOne | UpdateMany | UpdateOne]
+
+
+def flush(
+    collection: type[Collection], operations: Operations, ids: list[ObjectId]
+) -> int:
+    """Write batch, invalidate cached nodes and return updated documents."""
+    updated = collection.bulk_write(operations).modified_count
+    if collection is NodeAnchor.Collection:
+        # cached nodes still have refs of other format
+        ANCHOR_CACHE.invalidate(ids)
+    return updated
+
+
+def migrate(format: str, batch: int = 500, dry_run: bool = False) -> int:
+    """Rewrite every `edges` array that has refs of other format and return updated documents."""
+    architype.EDGE_REF_FORMAT = format
+    Collection.apply_indexes()
+
+    updated = 0
+    collections: list[type[Collection]] = [NodeAnchor.Collection, EdgeBucket.Collection]
+    for collection in collections:
+        operations: Operations = []
+        ids: list[ObjectId] = []
+        for doc in collection.collection().find(
+            {"edges.0": {"$exists": True}}, {"edges": True}
+        ):
+            edges = [EdgeAnchor.ref(ref).stored_ref for ref in doc["edges"]]
+            if edges != doc["edges"]:
+                if dry_run:
+                    updated += 1
+                    continue
+                # skip documents updated since read, rerun to convert them
+                operations.append(
+                    UpdateOne(
+                        {"_id": doc["_id"], "edges": doc["edges"]},
+                        {"$set": {"edges": edges}},
+                    )
+                )
+                ids.append(doc["_id"])
+            if len(operations) >= batch:
+                updated += flush(collection, operations, ids)
+                operations = []
+                ids = []
+        if operations:
+            updated += flush(collection, operations, ids)
+    return updated
+
+
+if __name__ == "__main__":
+    args = [arg for arg in argv[1:] if arg != "--dry-run"]
+    dry_run = "--dry-run" in argv
+    updated = migrate(args[0] if args else "compact", dry_run=dry_run)
+    print(f"{'documents to update' if dry_run else 'updated documents'}: {updated}")